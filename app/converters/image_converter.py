@@ -47,16 +47,26 @@ class ImageConverter:
         Returns:
             转换结果
         """
+        # PIL 编解码是同步的 CPU 密集工作，放到线程中执行避免阻塞事件循环
+        return await asyncio.to_thread(self._image_to_pdf, input_path, output_path, options)
+
+    def _image_to_pdf(
+        self,
+        input_path: str,
+        output_path: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """图片转 PDF 的同步实现"""
         try:
             # 打开图片
             with Image.open(input_path) as image:
                 # 转换为 RGB 模式
                 if image.mode != 'RGB':
                     image = image.convert('RGB')
-                
+
                 # 保存为 PDF
                 image.save(output_path, 'PDF', resolution=300.0)
-                
+
                 return {
                     'success': True,
                     'message': '图片转 PDF 成功'
@@ -89,12 +99,13 @@ class ImageConverter:
         """
         try:
             # 根据目标格式选择转换方法
+            # 文档构建是同步的 CPU 密集工作，放到线程中执行避免阻塞事件循环
             if target_format == 'docx':
-                return await self._image_to_docx(input_path, output_path, options)
+                return await asyncio.to_thread(self._image_to_docx, input_path, output_path, options)
             elif target_format == 'pptx':
-                return await self._image_to_pptx(input_path, output_path, options)
+                return await asyncio.to_thread(self._image_to_pptx, input_path, output_path, options)
             elif target_format == 'xlsx':
-                return await self._image_to_xlsx(input_path, output_path, options)
+                return await asyncio.to_thread(self._image_to_xlsx, input_path, output_path, options)
             else:
                 return {
                     'success': False,
@@ -107,10 +118,10 @@ class ImageConverter:
                 'error': f'图片转 Office 失败: {str(e)}'
             }
     
-    async def _image_to_docx(
-        self, 
-        input_path: str, 
-        output_path: str, 
+    def _image_to_docx(
+        self,
+        input_path: str,
+        output_path: str,
         options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """图片转换为 Word 文档"""
@@ -165,10 +176,10 @@ class ImageConverter:
                 'error': f'图片转 Word 失败: {str(e)}'
             }
     
-    async def _image_to_pptx(
-        self, 
-        input_path: str, 
-        output_path: str, 
+    def _image_to_pptx(
+        self,
+        input_path: str,
+        output_path: str,
         options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """图片转换为 PowerPoint 演示文稿"""
@@ -237,10 +248,10 @@ class ImageConverter:
                 'error': f'图片转 PowerPoint 失败: {str(e)}'
             }
     
-    async def _image_to_xlsx(
-        self, 
-        input_path: str, 
-        output_path: str, 
+    def _image_to_xlsx(
+        self,
+        input_path: str,
+        output_path: str,
         options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """图片转换为 Excel 工作簿"""
@@ -319,6 +330,19 @@ class ImageConverter:
         Returns:
             转换结果
         """
+        # PIL 编解码是同步的 CPU 密集工作，放到线程中执行避免阻塞事件循环
+        return await asyncio.to_thread(
+            self._image_to_image, input_path, output_path, target_format, options
+        )
+
+    def _image_to_image(
+        self,
+        input_path: str,
+        output_path: str,
+        target_format: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """图片格式转换的同步实现"""
         try:
             # 打开图片
             with Image.open(input_path) as image:
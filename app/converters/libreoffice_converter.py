@@ -244,64 +244,56 @@ class LibreOfficeConverter:
         temp_dir: str
     ) -> Dict[str, Any]:
         """执行转换命令"""
-        try:
-            # 直接执行转换，不使用进程池
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self._run_conversion_process,
-                cmd
-            )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"转换执行失败: {e}")
-            return {
-                'success': False,
-                'error': f'转换执行失败: {str(e)}'
-            }
-    
-    def _run_conversion_process(self, cmd: List[str]) -> Dict[str, Any]:
-        """在进程池中运行转换"""
         try:
             logger.info(f"执行转换命令: {' '.join(cmd)}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5分钟超时
+
+            # 原生异步子进程：不占用线程，事件循环在转换期间可调度其他任务
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            
-            logger.info(f"转换命令返回码: {result.returncode}")
-            logger.info(f"转换命令标准输出: {result.stdout}")
-            logger.info(f"转换命令错误输出: {result.stderr}")
-            
-            if result.returncode == 0:
+
+            try:
+                stdout_data, stderr_data = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=300  # 5分钟超时
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.error("转换超时")
+                return {
+                    'success': False,
+                    'error': '转换超时'
+                }
+
+            stdout = stdout_data.decode(errors='replace')
+            stderr = stderr_data.decode(errors='replace')
+
+            logger.info(f"转换命令返回码: {process.returncode}")
+            logger.info(f"转换命令标准输出: {stdout}")
+            logger.info(f"转换命令错误输出: {stderr}")
+
+            if process.returncode == 0:
                 return {
                     'success': True,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr
+                    'stdout': stdout,
+                    'stderr': stderr
                 }
             else:
                 return {
                     'success': False,
-                    'error': f'转换失败: {result.stderr}',
-                    'stdout': result.stdout,
-                    'stderr': result.stderr
+                    'error': f'转换失败: {stderr}',
+                    'stdout': stdout,
+                    'stderr': stderr
                 }
-                
-        except subprocess.TimeoutExpired:
-            logger.error("转换超时")
-            return {
-                'success': False,
-                'error': '转换超时'
-            }
+
         except Exception as e:
-            logger.error(f"转换异常: {e}")
+            logger.error(f"转换执行失败: {e}")
             return {
                 'success': False,
-                'error': f'转换异常: {str(e)}'
+                'error': f'转换执行失败: {str(e)}'
             }
     
     def _find_output_file(self, temp_dir: str, output_ext: str) -> Optional[Path]:
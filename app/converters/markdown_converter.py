@@ -3,6 +3,7 @@ Markdown 转换器
 支持 Markdown 与 PDF 之间的转换
 """
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -31,6 +32,73 @@ except ImportError as e:
     DEPENDENCIES_AVAILABLE = False
 
 
+def _is_heading(text: str) -> bool:
+    """检测是否为标题"""
+    # 简单的标题检测逻辑
+    return len(text) < 100 and text.isupper() and not text.endswith('.')
+
+
+def _is_list_item(text: str) -> bool:
+    """检测是否为列表项"""
+    return text.startswith(('•', '-', '*', '1.', '2.', '3.'))
+
+
+def _is_code_block(text: str) -> bool:
+    """检测是否为代码块"""
+    # 简单的代码块检测
+    return 'function' in text.lower() or 'class' in text.lower() or 'import' in text.lower()
+
+
+def _is_quote(text: str) -> bool:
+    """检测是否为引用"""
+    return text.startswith('"') or text.startswith('"')
+
+
+@functools.lru_cache(maxsize=512)
+def _format_text_to_markdown_impl(text: str, page_num: int) -> str:
+    """
+    将文本格式化为 Markdown（模块级纯函数，便于缓存）
+
+    相同页面文本重复转换时（用户重试、批量重转），直接复用缓存结果，
+    避免对每个段落重新运行所有检测器
+
+    Args:
+        text: 原始文本
+        page_num: 页码
+
+    Returns:
+        格式化的 Markdown 文本
+    """
+    # 添加页面标题
+    markdown_text = f"# 第 {page_num} 页\n\n"
+
+    # 分割文本为段落
+    paragraphs = text.split('\n\n')
+
+    for paragraph in paragraphs:
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+
+        # 检测标题
+        if _is_heading(paragraph):
+            markdown_text += f"## {paragraph}\n\n"
+        # 检测列表项
+        elif _is_list_item(paragraph):
+            markdown_text += f"- {paragraph}\n"
+        # 检测代码块
+        elif _is_code_block(paragraph):
+            markdown_text += f"```\n{paragraph}\n```\n\n"
+        # 检测引用
+        elif _is_quote(paragraph):
+            markdown_text += f"> {paragraph}\n\n"
+        # 普通段落
+        else:
+            markdown_text += f"{paragraph}\n\n"
+
+    return markdown_text
+
+
 class MarkdownConverter:
     """
     Markdown 转换器
@@ -887,8 +955,11 @@ class MarkdownConverter:
     def _add_excel_list(self, ws, element, current_row, content_font, border):
         """添加 Excel 列表"""
         is_ordered = element.name == 'ol'
-        
-        for li in element.find_all('li', recursive=False):
+
+        # 直接遍历子节点，跳过 find_all 的通用过滤开销
+        for li in element.children:
+            if getattr(li, 'name', None) != 'li':
+                continue
             text = li.get_text().strip()
             if text:
                 # 添加列表标记
@@ -948,7 +1019,8 @@ class MarkdownConverter:
             max_cols = max(len(row.find_all(['td', 'th'])) for row in rows)
             
             for i, row in enumerate(rows):
-                cells = row.find_all(['td', 'th'])
+                # 直接遍历子节点，跳过 find_all 的通用过滤开销
+                cells = [cell for cell in row.children if getattr(cell, 'name', None) in ('td', 'th')]
                 for j, cell in enumerate(cells):
                     if j < max_cols:
                         excel_cell = ws.cell(row=current_row + i, column=j + 1, value=cell.get_text().strip())
@@ -1098,62 +1170,33 @@ class MarkdownConverter:
     
     def _format_text_to_markdown(self, text: str, page_num: int) -> str:
         """
-        将文本格式化为 Markdown
-        
+        将文本格式化为 Markdown（结果按页面文本缓存）
+
         Args:
             text: 原始文本
             page_num: 页码
-            
+
         Returns:
             格式化的 Markdown 文本
         """
-        # 添加页面标题
-        markdown_text = f"# 第 {page_num} 页\n\n"
-        
-        # 分割文本为段落
-        paragraphs = text.split('\n\n')
-        
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
-            if not paragraph:
-                continue
-            
-            # 检测标题
-            if self._is_heading(paragraph):
-                markdown_text += f"## {paragraph}\n\n"
-            # 检测列表项
-            elif self._is_list_item(paragraph):
-                markdown_text += f"- {paragraph}\n"
-            # 检测代码块
-            elif self._is_code_block(paragraph):
-                markdown_text += f"```\n{paragraph}\n```\n\n"
-            # 检测引用
-            elif self._is_quote(paragraph):
-                markdown_text += f"> {paragraph}\n\n"
-            # 普通段落
-            else:
-                markdown_text += f"{paragraph}\n\n"
-        
-        return markdown_text
-    
+        return _format_text_to_markdown_impl(text, page_num)
+
     def _is_heading(self, text: str) -> bool:
         """检测是否为标题"""
-        # 简单的标题检测逻辑
-        return len(text) < 100 and text.isupper() and not text.endswith('.')
-    
+        return _is_heading(text)
+
     def _is_list_item(self, text: str) -> bool:
         """检测是否为列表项"""
-        return text.startswith(('•', '-', '*', '1.', '2.', '3.'))
-    
+        return _is_list_item(text)
+
     def _is_code_block(self, text: str) -> bool:
         """检测是否为代码块"""
-        # 简单的代码块检测
-        return 'function' in text.lower() or 'class' in text.lower() or 'import' in text.lower()
-    
+        return _is_code_block(text)
+
     def _is_quote(self, text: str) -> bool:
         """检测是否为引用"""
-        return text.startswith('"') or text.startswith('"')
-    
+        return _is_quote(text)
+
     def get_supported_formats(self) -> Dict[str, list]:
         """
         获取支持的转换格式
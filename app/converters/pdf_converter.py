@@ -2,6 +2,13 @@
 PDF 转换器
 """
 import asyncio
+import functools
+import hashlib
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from heapq import merge as _heap_merge
+from itertools import chain, groupby
+from operator import itemgetter
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from loguru import logger
@@ -13,36 +20,416 @@ try:
     from PIL import Image
     import pytesseract
 except ImportError as e:
+    # 此处还是顶部导入的 loguru logger（stdlib 重绑定在下方才发生），
+    # loguru 不认 %-style 惰性参数，须用 f-string
     logger.warning(f"PDF 转换器依赖库未安装: {e}")
 
 import os
+import re
+import shutil
+import struct
 import tempfile
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Sequence
 from pathlib import Path
 import fitz  # PyMuPDF
 from docx import Document
-from docx.shared import Pt, Inches
+from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_SECTION
 from docx.oxml.shared import OxmlElement, qn
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.drawing.image import Image as XLImage
+from openpyxl.styles import Alignment, Font
+from openpyxl.styles.colors import Color
+from pptx import Presentation
 from PIL import Image
+import numpy as np
 import io
 import base64
 from app.config.settings import USE_PDF2DOCX, PDF2DOCX_FALLBACK
 
 logger = logging.getLogger(__name__)
 
+# 文本提取标志：保留连字和空白，同时抑制额外生成的空格
+TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_INHIBIT_SPACES
+
+# span flags 中的样式位（预计算掩码，避免在热循环里反复求 2**k）
+FLAG_BOLD = 1 << 4
+FLAG_ITALIC = 1 << 1
+
+# span 样式签名，用于合并相邻同样式的文本片段
+_SPAN_STYLE_KEY = itemgetter("font", "size", "flags", "color")
+
+# 列表/bullet 识别用的预编译正则：模块加载时编译一次，
+# 避免在每行文本的判断里重复编译
+# 字号阈值查表：bisect 一次定位代替 4~5 层 if/elif 级联，
+# Pt 值在模块加载时预先构造
+_FONT_SIZE_THRESHOLDS = (12, 14, 18, 24)
+_ROW_HEIGHTS = (15, 18, 20, 25, 30)
+_LINE_SPACINGS = (1.1, 1.2, 1.3, 1.5, 1.8)
+_SPACE_AFTER_PTS = (Pt(4), Pt(6), Pt(8), Pt(12), Pt(16))
+_SPACE_BEFORE_PTS = (Pt(1), Pt(2), Pt(4), Pt(6), Pt(8))
+
+# _set_advanced_formatting 的段后距表（阈值 16/20）
+_ADV_THRESHOLDS = (16, 20)
+_ADV_SPACE_AFTER_PTS = (Pt(6), Pt(8), Pt(12))
+
+# 参考文档格式配方中的固定 Pt/Inches 值只构造一次
+def _fast_image_size(data):
+    """直接解析 PNG/JPEG 头部读取像素尺寸，未知格式回退到 PIL
+
+    PIL 即便只取 size 也要初始化整套解码器状态，
+    头部解析只触碰开头几十个字节
+    """
+    if len(data) >= 24 and data[:8] == b'\x89PNG\r\n\x1a\n':
+        return struct.unpack('>II', data[16:24])
+    if data[:2] == b'\xff\xd8':  # JPEG SOI
+        i = 2
+        n = len(data)
+        while i + 9 < n:
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            # SOF0-SOF15（除去 DHT/JPG/DAC）带有尺寸信息
+            if marker in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+                          0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                # 无长度字段的标记
+                i += 2
+                continue
+            i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+    with Image.open(io.BytesIO(data)) as pil_img:
+        return pil_img.size
+
+
+def _fast_add_run(paragraph, text, font_name, size_pt, bold, italic, color_hex=None):
+    """直接构造 <w:r> 子树追加到段落，绕过 python-docx 的属性层
+
+    逐 span 设置 run.font.* 每次都要走 descriptor + lxml 查找，
+    这里一次性拼好 rPr 再挂载，产出的 XML 与属性赋值结果一致
+    """
+    r = OxmlElement('w:r')
+    rPr = OxmlElement('w:rPr')
+    rFonts = OxmlElement('w:rFonts')
+    rFonts.set(qn('w:ascii'), font_name)
+    rFonts.set(qn('w:hAnsi'), font_name)
+    rPr.append(rFonts)
+    b = OxmlElement('w:b')
+    if not bold:
+        b.set(qn('w:val'), '0')
+    rPr.append(b)
+    i = OxmlElement('w:i')
+    if not italic:
+        i.set(qn('w:val'), '0')
+    rPr.append(i)
+    if color_hex:
+        color = OxmlElement('w:color')
+        color.set(qn('w:val'), color_hex)
+        rPr.append(color)
+    sz = OxmlElement('w:sz')
+    sz.set(qn('w:val'), str(int(size_pt * 2)))
+    rPr.append(sz)
+    r.append(rPr)
+    t = OxmlElement('w:t')
+    t.set(qn('xml:space'), 'preserve')
+    t.text = text
+    r.append(t)
+    paragraph._p.append(r)
+
+
+_PT_0 = Pt(0)
+_PT_0_1 = Pt(0.1)
+_PT_6 = Pt(6.0)
+_PT_12_95 = Pt(12.95)
+_IN_0 = Inches(0)
+_IN_NEG_0_003 = Inches(-0.003)
+_IN_NEG_0_007 = Inches(-0.007)
+_IN_NEG_0_010 = Inches(-0.010)
+_IN_NEG_0_138 = Inches(-0.138)
+_IN_NEG_0_393 = Inches(-0.393)
+_IN_0_394 = Inches(0.394)
+
+# 目标纸张尺寸（300 DPI 下的像素值，模块加载时算一次）
+_A4_SIZE_PX = (int(210 * 300 / 25.4), int(297 * 300 / 25.4))  # 210mm x 297mm
+_LETTER_SIZE_PX = (int(8.5 * 300), int(11 * 300))             # 8.5" x 11"
+
+_RANGE_TOKEN_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')  # 页面范围："3" 或 "1-5"
+
+# 字体名风格特征：一次正则扫描代替多个子串判断
+_BOLD_FONT_RE = re.compile(r'bold|heavy|black|extra', re.IGNORECASE)
+_ITALIC_FONT_RE = re.compile(r'italic|oblique', re.IGNORECASE)
+
+# 页眉关键词：单次 C 级扫描代替逐关键词 lower()+in 判断
+_HEADER_RE = re.compile(r'a/inb|geneva|november|december', re.IGNORECASE)
+
+# 结构分析关键词：与上面同理，每类关键词合并为一个编译好的选择分支
+_TITLE_KEYWORD_RE = re.compile(
+    r'meeting|negotiating|body|convention|agreement|international'
+    r'|instrument|pandemic|prevention|preparedness|response',
+    re.IGNORECASE,
+)
+_SECTION_KEYWORD_RE = re.compile(r'agenda|provisional|opening|closure', re.IGNORECASE)
+_LIST_KEYWORD_RE = re.compile(
+    r'opening|conceptual|proposal|information|summaries|informal'
+    r'|secretariat|report|closure',
+    re.IGNORECASE,
+)
+_HEADER_OPT_RE = re.compile(r'a/inb|geneva|november|december|2022', re.IGNORECASE)
+
+# 四组分类关键词合并成带命名分组的单一模式，一趟 finditer 即可收齐命中情况
+# （opening/closure 只放在 section 组：章节判断优先于列表判断，语义不变）
+_CLASSIFY_RE = re.compile(
+    r'(?P<title>meeting|negotiating|body|convention|agreement|international'
+    r'|instrument|pandemic|prevention|preparedness|response)'
+    r'|(?P<section>agenda|provisional|opening|closure)'
+    r'|(?P<list>conceptual|proposal|information|summaries|informal'
+    r'|secretariat|report)'
+    r'|(?P<header>a/inb|geneva|november|december|2022)',
+    re.IGNORECASE,
+)
+
+
+def _scan_keywords(text):
+    """单趟扫描文本，返回 (标题, 章节, 列表, 页眉) 关键词命中标志"""
+    title_hit = section_hit = list_hit = header_hit = False
+    for m in _CLASSIFY_RE.finditer(text):
+        g = m.lastgroup
+        if g == 'title':
+            title_hit = True
+        elif g == 'section':
+            section_hit = True
+        elif g == 'list':
+            list_hit = True
+        else:
+            header_hit = True
+    return title_hit, section_hit, list_hit, header_hit
+
+_LIST_NUM_RE = re.compile(r'^\d+\.')          # 数字编号：1. 2. 3.
+_LIST_ALPHA_RE = re.compile(r'^[a-z]\.')      # 字母编号：a. b. c.
+_LIST_ROMAN_RE = re.compile(r'^[ivxlcdm]+\.', re.IGNORECASE)  # 罗马数字：i. ii. iii.
+# 三类编号前缀合并为一个模式（字母编号保持仅小写，与单独的模式语义一致）
+_LIST_PREFIX_RE = re.compile(r'^(?:\d+\.|[a-z]\.|[ivxlcdmIVXLCDM]+\.)')
+
+# bullet 起始字符集合：frozenset 让首字符判断变成一次哈希查找
+_BULLET_CHARS = frozenset((
+    '•', '◦', '‣', '▪', '▫', '▸', '▹', '▻', '▽', '▾',
+    '-', '*', '+', '→', '⇒', '▶', '►', '▷', '◁', '◀',
+    '◆', '◇', '◈', '◉', '◎', '●', '○', '◐', '◑', '◒',
+    '◓', '◔', '◕', '◖', '◗', '◘', '◙', '◚', '◛', '◜',
+    '◝', '◞', '◟', '◠', '◡', '◢', '◣', '◤', '◥', '◦',
+    '◧', '◨', '◩', '◪', '◫', '◬', '◭', '◮', '◯', '◰',
+    '◱', '◲', '◳', '◴', '◵', '◶', '◷', '◸', '◹', '◺',
+    '◻', '◼', '◽', '◾', '◿', '☀', '☁', '☂', '☃', '☄',
+    '★', '☆', '☎', '☏', '☐', '☑', '☒', '☓', '☔', '☕',
+    '☖', '☗', '☘', '☙', '☚', '☛', '☜', '☝', '☞', '☟',
+    '☠', '☡', '☢', '☣', '☤', '☥', '☦', '☧', '☨', '☩',
+    '☪', '☫', '☬', '☭', '☮', '☯', '☰', '☱', '☲', '☳',
+    '☴', '☵', '☶', '☷', '☸', '☹', '☺', '☻', '☼', '☽',
+    '☾', '☿', '♀', '♂', '♁', '♂', '♃', '♄', '♅', '♆',
+    '♇', '♈', '♉', '♊', '♋', '♌', '♍', '♎', '♏', '♐',
+    '♑', '♒', '♓', '♔', '♕', '♖', '♗', '♘', '♙', '♚',
+    '♛', '♜', '♝', '♞', '♟', '♠', '♡', '♢', '♣', '♤',
+    '♥', '♦', '♧', '♨', '♩', '♪', '♫', '♬', '♭', '♮',
+    '♯', '♰', '♱', '♲', '♳', '♴', '♵', '♶', '♷', '♸',
+    '♹', '♺', '♻', '♼', '♽', '♾', '♿', '⚀', '⚁', '⚂',
+    '⚃', '⚄', '⚅', '⚆', '⚇', '⚈', '⚉', '⚊', '⚋', '⚌',
+    '⚍', '⚎', '⚏', '⚐', '⚑', '⚒', '⚓', '⚔', '⚕', '⚖',
+    '⚗', '⚘', '⚙', '⚚', '⚛', '⚜', '⚝', '⚞', '⚟', '⚠',
+    '⚡', '⚢', '⚣', '⚤', '⚥', '⚦', '⚧', '⚨', '⚩', '⚪',
+    '⚫', '⚬', '⚭', '⚮', '⚯', '⚰', '⚱', '⚲', '⚳', '⚴',
+    '⚵', '⚶', '⚷', '⚸', '⚹', '⚺', '⚻', '⚼', '⚽', '⚾',
+    '⚿', '⛀', '⛁', '⛂', '⛃', '⛄', '⛅', '⛆', '⛇', '⛈',
+    '⛉', '⛊', '⛋', '⛌', '⛍', '⛎', '⛏', '⛐', '⛑', '⛒',
+    '⛓', '⛔', '⛕', '⛖', '⛗', '⛘', '⛙', '⛚', '⛛', '⛜',
+    '⛝', '⛞', '⛟', '⛠', '⛡', '⛢', '⛣', '⛤', '⛥', '⛦',
+    '⛧', '⛨', '⛩', '⛪', '⛫', '⛬', '⛭', '⛮', '⛯', '⛰',
+    '⛱', '⛲', '⛳', '⛴', '⛵', '⛶', '⛷', '⛸', '⛹', '⛺',
+    '⛻', '⛼', '⛽', '⛾', '⛿'
+))
+
+_BULLET_PATTERNS = tuple(re.compile(p) for p in (
+    r'^[•◦‣▪▫▸▹▻▽▾→⇒▶►▷◁◀◆◇◈◉◎●○◐◑◒◓◔◕◖◗◘◙◚◛◜◝◞◟◠◡◢◣◤◥◦◧◨◩◪◫◬◭◮◯◰◱◲◳◴◵◶◷◸◹◺◻◼◽◾◿☀☁☂☃☄★☆☎☏☐☑☒☓☔☕☖☗☘☙☚☛☜☝☞☟☠☡☢☣☤☥☦☧☨☩☪☫☬☭☮☯☰☱☲☳☴☵☶☷☸☹☺☻☼☽☾☿♀♂♁♂♃♄♅♆♇♈♉♊♋♌♍♎♏♐♑♒♓♔♕♖♗♘♙♚♛♜♝♞♟♠♡♢♣♤♥♦♧♨♩♪♫♬♭♮♯♰♱♲♳♴♵♶♷♸♹♺♻♼♽♾♿⚀⚁⚂⚃⚄⚅⚆⚇⚈⚉⚊⚋⚌⚍⚎⚏⚐⚑⚒⚓⚔⚕⚖⚗⚘⚙⚚⚛⚜⚝⚞⚟⚠⚡⚢⚣⚤⚥⚦⚧⚨⚩⚪⚫⚬⚭⚮⚯⚰⚱⚲⚳⚴⚵⚶⚷⚸⚹⚺⚻⚼⚽⚾⚿⛀⛁⛂⛃⛄⛅⛆⛇⛈⛉⛊⛋⛌⛍⛎⛏⛐⛑⛒⛓⛔⛕⛖⛗⛘⛙⛚⛛⛜⛝⛞⛟⛠⛡⛢⛣⛤⛥⛦⛧⛨⛩⛪⛫⛬⛭⛮⛯⛰⛱⛲⛳⛴⛵⛶⛷⛸⛹⛺⛻⛼⛽⛾⛿]\s+',  # 各种 bullet 字符后跟空格
+    r'^[-*+]\s+',  # 常见的 bullet 字符
+    r'^[→⇒▶►▷◁◀]\s+',  # 箭头类 bullet
+    r'^[◆◇◈◉◎●○]\s+',  # 圆形类 bullet
+    r'^[★☆]\s+',  # 星形类 bullet
+    r'^[☐☑☒]\s+',  # 复选框类 bullet
+))
+
+# PDF 字体名 -> Word 字体名映射（键已统一小写，查找时只需小写一次）
+_FONT_MAPPING = {
+    # 常见字体映射
+    'Arial': 'Arial',
+    'Arial-Bold': 'Arial',
+    'Arial-Italic': 'Arial',
+    'Arial-BoldItalic': 'Arial',
+    'ArialMT': 'Arial',
+    'Arial-BoldMT': 'Arial',
+    'Times': 'Times New Roman',
+    'Times-Bold': 'Times New Roman',
+    'Times-Italic': 'Times New Roman',
+    'Times-BoldItalic': 'Times New Roman',
+    'TimesNewRomanPSMT': 'Times New Roman',
+    'TimesNewRomanPS-BoldMT': 'Times New Roman',
+    'Helvetica': 'Arial',
+    'Helvetica-Bold': 'Arial',
+    'Helvetica-Italic': 'Arial',
+    'Helvetica-BoldItalic': 'Arial',
+    'Courier': 'Courier New',
+    'Courier-Bold': 'Courier New',
+    'Courier-Italic': 'Courier New',
+    'Courier-BoldItalic': 'Courier New',
+    'SimSun': 'SimSun',
+    'SimHei': 'SimHei',
+    'Microsoft YaHei': 'Microsoft YaHei',
+    'KaiTi': 'KaiTi',
+    'FangSong': 'FangSong',
+    # 添加 FranklinGothic 字体映射
+    'FranklinGothic-Book': 'Arial',
+    'FranklinGothic': 'Arial',
+    'Franklin': 'Arial',
+    'Calibri': 'Calibri',
+    'Calibri-Bold': 'Calibri',
+    'Calibri-Italic': 'Calibri',
+}
+
+# 子串匹配按键长降序：长键（如 arial-bolditalic）先于其前缀（arial）命中
+_FONT_MAP_LOWER = tuple(sorted(
+    ((k.lower(), v) for k, v in _FONT_MAPPING.items()),
+    key=lambda kv: -len(kv[0])
+))
+
+
+# Excel 字体名映射表（模块级构建一次）
+_EXCEL_FONT_MAPPING = {
+    'Arial': 'Arial',
+    'Times': 'Times New Roman',
+    'Helvetica': 'Arial',
+    'Courier': 'Courier New',
+    'Calibri': 'Calibri',
+    'SimSun': 'SimSun',
+    'SimHei': 'SimHei',
+    'Microsoft YaHei': 'Microsoft YaHei'
+}
+
+# 共享的 Alignment 对象：openpyxl 样式对象不可变，可安全跨单元格复用
+_ALIGN_CACHE = {h: Alignment(horizontal=h) for h in ('left', 'right', 'center', 'justify')}
+
+# Word 对齐代码查表（_classify_alignments 返回的代码按此下标取值）
+_ALIGN_LOOKUP = (
+    WD_ALIGN_PARAGRAPH.LEFT,
+    WD_ALIGN_PARAGRAPH.CENTER,
+    WD_ALIGN_PARAGRAPH.RIGHT,
+    WD_ALIGN_PARAGRAPH.JUSTIFY,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _make_excel_font(name: str) -> Font:
+    """按字体名缓存 Font 对象，避免逐单元格构造"""
+    return Font(name=name)
+
+
+def _pdf_bytes_digest(pdf_bytes: bytes) -> bytes:
+    """计算 PDF 字节串的摘要，作为跨转换页面缓存的键
+
+    每次转换入口只算一次，随调用链下传；不做记忆化，
+    避免把整份上传字节钉在进程级缓存里
+    """
+    return hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=256)
+def _convert_color_tuple(color: int) -> Optional[tuple]:
+    """将 24 位 PDF 颜色值拆成 RGB 元组（黑色 0 返回 None）
+
+    文档中的颜色高度重复，lru_cache 让逐 span 的转换退化为字典探查
+    """
+    if color == 0:  # 黑色
+        return None
+    return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_rgb_color(color: int) -> RGBColor:
+    """按颜色值缓存 docx RGBColor 对象，避免重复实例化"""
+    return RGBColor((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+
+
+@functools.lru_cache(maxsize=512)
+def _map_pdf_font(pdf_font_name: str) -> str:
+    """将 PDF 字体名映射到 Word 字体名
+
+    每页的 span 通常只用到少数几个字体名，lru_cache 让重复查询
+    退化为一次字典探查
+    """
+    # 清理字体名
+    clean_font_lower = pdf_font_name.split('+')[-1].lower()  # 移除字体子集前缀
+
+    # 查找映射（长键优先，避免前缀键抢先命中）
+    for pdf_font, word_font in _FONT_MAP_LOWER:
+        if pdf_font in clean_font_lower:
+            return word_font
+
+    # 如果没有找到映射，根据字体特征推断
+    if 'times' in clean_font_lower or 'roman' in clean_font_lower:
+        return 'Times New Roman'
+    elif 'arial' in clean_font_lower or 'helvetica' in clean_font_lower:
+        return 'Arial'
+    elif 'courier' in clean_font_lower or 'mono' in clean_font_lower:
+        return 'Courier New'
+    elif 'calibri' in clean_font_lower:
+        return 'Calibri'
+    else:
+        # 默认使用 Arial
+        return 'Arial'
+
+
 class PDFConverter:
     """
     PDF 转换器 - 支持混合方案
     可以选择使用 pdf2docx 或自定义实现
     """
-    
+
+    # 所有实例共享的工作线程池：多个并发请求复用同一批工作线程，
+    # 避免每次转换都创建/销毁线程池（延迟初始化）
+    _shared_executor = None
+
+    @classmethod
+    def _get_executor(cls):
+        """获取共享的工作线程池（首次调用时创建）"""
+        if cls._shared_executor is None:
+            cls._shared_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix='pdfconv'
+            )
+        return cls._shared_executor
+
     def __init__(self):
         self.use_pdf2docx = USE_PDF2DOCX
         self.pdf2docx_fallback = PDF2DOCX_FALLBACK
-        
+
+        # Font 样式对象缓存，按 (字体, 大小, 粗体, 斜体, 颜色) 复用
+        self._font_cache = {}
+
+        # 图片边界框缓存，按 (PDF 摘要, 页码, xref) 复用 get_image_bbox
+        # 的结果；按上限淘汰，不随单次转换清空
+        self._image_bbox_cache = {}
+
+        # 页面图片列表缓存，按 (PDF 摘要, 页码) 复用 get_images 的
+        # xref 扫描结果；按上限淘汰，不随单次转换清空
+        self._page_images_cache = {}
+
+        # 跨转换的页面文本缓存，按 (PDF 摘要, 页码, flags) 复用 get_text
+        # 的结果：同一份 PDF 批量转多种格式时第二种起免去重复解析。
+        # 缓存值在下游只读，按 LRU 上限淘汰，不随单次转换清空
+        self._page_text_cache = {}
+
         # 检查 pdf2docx 是否可用
         self.pdf2docx_available = self._check_pdf2docx_availability()
         
@@ -79,19 +466,30 @@ class PDFConverter:
             转换结果
         """
         try:
+            # 一次性读入 PDF 字节：各转换方法（含工作线程）从内存打开，
+            # 避免每次 fitz.open 都重新读盘和解析 xref 表
+            pdf_bytes = Path(input_path).read_bytes()
+
+            # 摘要整个转换只算一次，作为页面级缓存的文档标识下传
+            pdf_digest = _pdf_bytes_digest(pdf_bytes)
+
             if target_format == 'docx':
-                return await self._pdf_to_docx(input_path, output_path, options)
+                return await self._pdf_to_docx(
+                    input_path, output_path, options, pdf_bytes, pdf_digest
+                )
             elif target_format == 'xlsx':
-                return await self._pdf_to_xlsx(input_path, output_path, options)
+                return await self._pdf_to_xlsx(
+                    input_path, output_path, options, pdf_bytes, pdf_digest
+                )
             elif target_format == 'pptx':
-                return await self._pdf_to_pptx(input_path, output_path, options)
+                return await self._pdf_to_pptx(input_path, output_path, options, pdf_bytes)
             else:
                 return {
                     'success': False,
                     'error': f'不支持 PDF 转换到 {target_format}'
                 }
         except Exception as e:
-            logger.error(f"PDF 转 Office 失败: {e}")
+            logger.error("PDF 转 Office 失败: %s", e)
             return {
                 'success': False,
                 'error': f'PDF 转 Office 失败: {str(e)}'
@@ -119,214 +517,289 @@ class PDFConverter:
         try:
             return await self._pdf_to_image(input_path, output_path, target_format, options)
         except Exception as e:
-            logger.error(f"PDF 转图片失败: {e}")
+            logger.error("PDF 转图片失败: %s", e)
             return {
                 'success': False,
                 'error': f'PDF 转图片失败: {str(e)}'
             }
     
+    # 图片边界框缓存上限：超出按最早插入淘汰
+    _IMAGE_BBOX_CACHE_LIMIT = 1024
+
+    def _get_cached_image_bbox(self, page, image_info, pdf_digest=None):
+        """带缓存的 get_image_bbox：同一张图片的几何查询只做一次
+
+        PyMuPDF 每次 get_image_bbox 都会重新遍历页面的图片字典；
+        缓存键用转换入口算好的 PDF 摘要标识文档——id(文档) 会随
+        对象地址复用在并发转换间串键。没有摘要时直接查询，不缓存
+        """
+        if pdf_digest is None:
+            return page.get_image_bbox(image_info)
+
+        try:
+            xref = image_info[0] if isinstance(image_info, (list, tuple)) else image_info
+            key = (pdf_digest, page.number, int(xref))
+        except (TypeError, ValueError, IndexError):
+            # 无法构造键时直接查询，不缓存
+            return page.get_image_bbox(image_info)
+
+        cache = self._image_bbox_cache
+        rect = cache.get(key)
+        if rect is None:
+            rect = page.get_image_bbox(image_info)
+            if len(cache) >= self._IMAGE_BBOX_CACHE_LIMIT:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = rect
+        return rect
+
+    # 页面图片列表缓存上限：超出按最早插入淘汰
+    _PAGE_IMAGES_CACHE_LIMIT = 512
+
+    def _get_page_images(self, page, pdf_digest=None):
+        """带缓存的 get_images：同一文档同一页的 xref 扫描只做一次
+
+        与 _get_cached_image_bbox 一样以 PDF 摘要标识文档，
+        避免 id(文档) 地址复用导致并发转换间串键；
+        没有摘要时直接查询，不缓存
+        """
+        if pdf_digest is None:
+            return page.get_images()
+
+        key = (pdf_digest, page.number)
+        cache = self._page_images_cache
+        images = cache.get(key)
+        if images is None:
+            images = page.get_images()
+            if len(cache) >= self._PAGE_IMAGES_CACHE_LIMIT:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = images
+        return images
+
+    # 页面文本缓存上限：256 页之外按 LRU 淘汰
+    _PAGE_TEXT_CACHE_LIMIT = 256
+
+    def _get_page_text_dict(self, page, page_num, pdf_digest=None, flags=None):
+        """带跨转换缓存的 get_text("dict")
+
+        以 (PDF 摘要, 页码, flags) 为键缓存解析结果，同一份 PDF 在一个
+        批次里转多种格式时，第二种格式起跳过 fitz 的文本解析。
+        返回的字典在下游必须按只读使用
+        """
+        if pdf_digest is None:
+            # 没有文档摘要就无法得到稳定的键，直接解析
+            if flags is None:
+                return page.get_text("dict")
+            return page.get_text("dict", flags=flags)
+
+        key = (pdf_digest, page_num, flags)
+        cache = self._page_text_cache
+        text_dict = cache.get(key)
+        if text_dict is None:
+            if flags is None:
+                text_dict = page.get_text("dict")
+            else:
+                text_dict = page.get_text("dict", flags=flags)
+            if len(cache) >= self._PAGE_TEXT_CACHE_LIMIT:
+                # 淘汰最久未使用的条目（dict 保持插入序）
+                cache.pop(next(iter(cache)), None)
+        else:
+            # 命中后移到末尾，维持 LRU 序
+            cache.pop(key, None)
+        cache[key] = text_dict
+        return text_dict
+
+    def _open_pdf(self, input_path: str, pdf_bytes: Optional[bytes] = None):
+        """打开 PDF 文档：有内存字节时直接从内存打开，避免重复读盘"""
+        if pdf_bytes is not None:
+            return fitz.open(stream=pdf_bytes, filetype='pdf')
+        return fitz.open(input_path)
+
     async def _pdf_to_docx(
-        self, 
-        input_path: str, 
-        output_path: str, 
-        options: Optional[Dict[str, Any]] = None
+        self,
+        input_path: str,
+        output_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         PDF 转 Word - 混合方案
         优先使用 pdf2docx，失败时回退到自定义实现
         """
-        
-        # 如果启用 pdf2docx 且可用，优先使用
+
+        # 如果启用 pdf2docx 且可用，优先使用（pdf2docx 只接受文件路径）
         if self.use_pdf2docx and self.pdf2docx_available:
             try:
                 logger.info("使用 pdf2docx 进行 PDF 转 Word 转换")
                 return await self._pdf_to_docx_with_pdf2docx(input_path, output_path, options)
             except Exception as e:
-                logger.warning(f"pdf2docx 转换失败: {e}")
+                logger.warning("pdf2docx 转换失败: %s", e)
                 if self.pdf2docx_fallback:
                     logger.info("回退到自定义实现")
-                    return await self._pdf_to_docx_custom(input_path, output_path, options)
+                    return await self._pdf_to_docx_custom(
+                        input_path, output_path, options, pdf_bytes, pdf_digest
+                    )
                 else:
                     raise e
-        
+
         # 使用自定义实现
         logger.info("使用自定义实现进行 PDF 转 Word 转换")
-        return await self._pdf_to_docx_custom(input_path, output_path, options)
+        return await self._pdf_to_docx_custom(
+            input_path, output_path, options, pdf_bytes, pdf_digest
+        )
     
     async def _pdf_to_xlsx(
-        self, 
-        input_path: str, 
-        output_path: str, 
-        options: Optional[Dict[str, Any]] = None
+        self,
+        input_path: str,
+        output_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """PDF 转换为 Excel 文档"""
         try:
-
-            from openpyxl import Workbook
-            from openpyxl.drawing.image import Image as XLImage
-            import fitz  # PyMuPDF
-            
             # 创建 Excel 工作簿
             wb = Workbook()
             ws = wb.active
-            
-            # 用于跟踪临时文件
-            temp_files = []
-            
-            # 使用 PyMuPDF 提取表格和图片
-            pdf_document = fitz.open(input_path)
-            
-            # 处理页面范围
+
+            # 会话临时目录：所有图片写入同一目录，结束后整体删除
+            session_tmpdir = tempfile.mkdtemp(prefix='pdfxlsx_')
+
+            # 处理页面范围（只为获取页数短暂打开文档）
+            pdf_document = self._open_pdf(input_path, pdf_bytes)
             pages = self._get_pages_to_process(pdf_document, options)
-            
+            pdf_document.close()
+
+            # 并行解析页面：PyMuPDF 的 C 代码会释放 GIL，
+            # 每个工作线程打开自己的文档句柄（跨线程共享文档不安全），
+            # 主线程按页面顺序写入 openpyxl；线程池跨请求共享
+            loop = asyncio.get_running_loop()
+            pool = self._get_executor()
+            parsed_pages = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, self._parse_xlsx_page, input_path, page_num, options,
+                    session_tmpdir, pdf_bytes, pdf_digest
+                )
+                for page_num in pages
+            ])
+
             current_row = 1
-            
-            for page_num in pages:
-                page = pdf_document[page_num - 1]
-                
-                # 收集页面上的所有内容（文本和图片），按位置排序
-                page_content = self._collect_page_content(page, page_num, pdf_document, options)
-                
-                # 按垂直位置排序内容
-                page_content.sort(key=lambda x: x['y_position'])
-                
+
+            for page_num, page_content, page_width, page_temp_files in parsed_pages:
                 # 按顺序处理内容 - 应用智能文本处理
-                current_paragraph = None
-                current_line_bbox = None
+                # 单元格先缓冲成整行，再通过 ws.append 一次写入，
+                # 避免逐单元格 ws.cell 的坐标解析和样式查表开销
+                row_cells = []
                 current_max_font_size = 0
-                
+
                 for content in page_content:
                     if content['type'] == 'text':
                         # 智能处理文本
                         line = content['data']
-                        
+
                         # 获取行的边界框信息
                         line_bbox = [0, 0, 0, 0]
                         if line["spans"]:
                             first_span = line["spans"][0]
                             line_bbox = first_span.get("bbox", [0, 0, 0, 0])
-                        
-                        page_width = page.rect.width
-                        
-                        # 检查是否需要创建新行
-                        should_create_new_row = True
-                        
-                        # 如果当前行存在，检查是否可以继续使用
-                        if current_paragraph is not None:
-                            # 检查垂直距离 - 如果距离很近，可能是同一行的延续
-                            if current_line_bbox and len(current_line_bbox) >= 4 and len(line_bbox) >= 4:
-                                vertical_distance = abs(line_bbox[1] - current_line_bbox[1])
-                                # 如果垂直距离小于字体大小的一半，认为是同一行
-                                if vertical_distance < 10:  # 10像素的阈值
-                                    should_create_new_row = False
-                        
-                        # 创建新行或使用现有行
-                        if should_create_new_row:
-                            # 完成当前行
-                            if current_paragraph is not None:
-                                # 设置当前行的格式
-                                if current_max_font_size > 0:
-                                    self._set_excel_row_format(ws, current_row, current_max_font_size)
-                            
-                            # 创建新行
-                            current_row += 1
-                            current_line_bbox = line_bbox
+
+                        # 换行标记已在工作线程中用 numpy 批量预计算
+                        if content.get('new_row', True) and row_cells:
+                            # 写出当前行
+                            current_row = self._append_excel_row(ws, row_cells, current_max_font_size)
+                            row_cells = []
                             current_max_font_size = 0
-                        
-                        # 处理每个文本片段
-                        col_idx = 1
+
+                        # 先按样式合并相邻文本片段：一条视觉行常被按字体切成
+                        # 多个 span，样式相同的相邻片段合并成一个单元格，
+                        # 大幅减少单元格数量和 Font 赋值次数
+                        runs = []  # [(文本片段列表, 样式键)]
                         for span in line["spans"]:
-                            span_text = span["text"]
-                            if span_text.strip():
-                                # 设置单元格值
-                                cell = ws.cell(row=current_row, column=col_idx, value=span_text.strip())
-                                
-                                # 创建字体样式
-                                from openpyxl.styles import Font
-                                font_name = span.get("font", "Arial")
-                                span_size = span.get("size", 12)
-                                excel_font_size = max(8, min(72, span_size * 0.75))
-                                span_flags = span.get("flags", 0)
-                                
-                                # 创建字体对象
-                                font = Font(
-                                    name=font_name,
-                                    size=excel_font_size,
-                                    bold=bool(span_flags & 2**4),
-                                    italic=bool(span_flags & 2**1)
-                                )
-                                
-                                # 设置颜色
-                                span_color = span.get("color", 0)
-                                if span_color != 0:
-                                    rgb_color = self._convert_color_to_rgb(span_color)
-                                    if rgb_color:
-                                        try:
-                                            from openpyxl.styles.colors import Color
-                                            font.color = Color(rgb=rgb_color)
-                                        except Exception as color_error:
-                                            logger.warning(f"设置字体颜色失败: {color_error}")
-                                
-                                # 应用字体样式
-                                cell.font = font
-                                current_max_font_size = max(current_max_font_size, excel_font_size)
-                                
-                                # 对齐方式
-                                self._set_excel_cell_alignment(cell, line_bbox, page_width)
-                                
-                                col_idx += 1
-                    
+                            span_text = span["text"].strip()
+                            if not span_text:
+                                continue
+                            span_size = span.get("size", 12)
+                            style_key = (
+                                span.get("font", "Arial"),
+                                max(8, min(72, span_size * 0.75)),
+                                span.get("flags", 0),
+                                span.get("color", 0)
+                            )
+                            if runs and runs[-1][1] == style_key:
+                                runs[-1][0].append(span_text)
+                            else:
+                                runs.append(([span_text], style_key))
+
+                        # 每个不同样式的合并片段生成一个单元格（随整行一起追加）
+                        for texts, style_key in runs:
+                            font_name, excel_font_size, span_flags, span_color = style_key
+                            cell = WriteOnlyCell(ws, value=' '.join(texts))
+
+                            # 应用缓存的字体样式
+                            cell.font = self._get_span_font(
+                                font_name, excel_font_size, span_flags, span_color
+                            )
+                            current_max_font_size = max(current_max_font_size, excel_font_size)
+
+                            # 对齐方式
+                            self._set_excel_cell_alignment(cell, line_bbox, page_width)
+
+                            row_cells.append(cell)
+
+                    elif content['type'] == 'table':
+                        # 先写出缓冲中的文本行，再整体输出表格
+                        if row_cells:
+                            current_row = self._append_excel_row(ws, row_cells, current_max_font_size)
+                            row_cells = []
+                            current_max_font_size = 0
+
+                        # 每个检测到的表格行直接映射为一个 Excel 行
+                        for table_row in content['data']:
+                            ws.append(['' if v is None else v for v in table_row])
+                        current_row = ws._current_row
+
                     elif content['type'] == 'image':
-                        # 处理图片
-                        img_data = content['data']
+                        # 处理图片（提取和尺寸计算已在工作线程中完成）
                         try:
-                            # 使用安全的方法提取图片
-                            temp_img_path = self._extract_image_safely(
-                                pdf_document, img_data['img'], img_data['page_num'], img_data['img_index']
-                            )
-                            
+                            # 先写出缓冲中的文本行，保证图片锚点在其下方
+                            if row_cells:
+                                current_row = self._append_excel_row(ws, row_cells, current_max_font_size)
+                                row_cells = []
+                                current_max_font_size = 0
+
+                            temp_img_path = content.get('temp_path')
+
                             if temp_img_path:
-                                # 智能计算图片尺寸
-                                img_width, img_height = self._calculate_smart_excel_image_size(
-                                    pdf_document, img_data['img'], img_data['page_num'], img_data['img_index'], options
-                                )
-                                
+                                img_width, img_height = content['size']
+
                                 # 添加图片到 Excel
                                 img = XLImage(temp_img_path)
                                 img.width = img_width
                                 img.height = img_height
-                                ws.add_image(img, f'A{current_row}')
-                                
-                                logger.info(f"添加图片: 智能缩放为 {img_width}x{img_height} 像素，位置: Y={content['y_position']}")
-                                
-                                # 根据图片高度调整行间距
+                                ws.add_image(img, f'A{current_row + 1}')
+
+                                logger.info("添加图片: 智能缩放为 %sx%s 像素，位置: Y=%s", img_width, img_height, content['y_position'])
+
+                                # 根据图片高度预留空行
                                 row_height = max(10, img_height // 20)
-                                current_row += row_height
-                                
-                                # 添加到临时文件列表，稍后清理
-                                temp_files.append(temp_img_path)
-                            
+                                current_row = self._advance_excel_rows(ws, row_height)
+
                         except Exception as img_error:
-                            logger.warning(f"处理图片失败: {img_error}")
+                            logger.warning("处理图片失败: %s", img_error)
                             continue
-                
+
+                # 写出页面最后一行
+                if row_cells:
+                    current_row = self._append_excel_row(ws, row_cells, current_max_font_size)
+
                 # 添加页面分隔
-                current_row += 2
-            
-            # 关闭 PDF 文档
-            pdf_document.close()
-            
+                current_row = self._advance_excel_rows(ws, 2)
+
             # 保存工作簿
             wb.save(output_path)
             
-            # 保存完成后再清理临时文件
-            import os
-            for temp_file in temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception as e:
-                    logger.warning(f"清理临时文件失败: {e}")
+            # 保存完成后整体删除会话临时目录
+            shutil.rmtree(session_tmpdir, ignore_errors=True)
             
             return {
                 'success': True,
@@ -334,52 +807,147 @@ class PDFConverter:
             }
             
         except Exception as e:
-            logger.error(f"PDF 转 Excel 失败: {e}")
+            logger.error("PDF 转 Excel 失败: %s", e)
             return {
                 'success': False,
                 'error': f'PDF 转 Excel 失败: {str(e)}'
             }
     
+    def _parse_xlsx_page(
+        self,
+        input_path: str,
+        page_num: int,
+        options: Optional[Dict[str, Any]] = None,
+        tmpdir: Optional[str] = None,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[bytes] = None
+    ) -> Tuple[int, List[Dict[str, Any]], float, List[str]]:
+        """
+        在工作线程中解析单个页面（供 _pdf_to_xlsx 并行调用）
+
+        每个线程打开自己的 fitz 文档句柄，图片提取和尺寸计算
+        也在线程内完成，使 Pixmap 解码可以并行
+
+        Returns:
+            (页码, 页面内容列表, 页面宽度, 临时图片文件列表)
+        """
+
+        # 优先从共享的内存字节打开，工作线程无需各自读盘
+        pdf_document = self._open_pdf(input_path, pdf_bytes)
+        try:
+            page = pdf_document[page_num - 1]
+            page_width = page.rect.width
+
+            # 收集页面上的所有内容（文本和图片），按位置排序
+            page_content = self._collect_page_content(
+                page, page_num, pdf_document, options, pdf_digest
+            )
+
+            # 用 PyMuPDF 的表格检测（C 实现）还原真实表格：
+            # 表格区域整体输出结构化行，区域内的散落文本不再逐 span 处理
+            try:
+                table_regions = []
+                for tab in page.find_tables(strategy='lines_strict'):
+                    rows = tab.extract()
+                    if not rows:
+                        continue
+                    bbox = tab.bbox  # (x0, y0, x1, y1)
+                    table_regions.append((bbox[1], bbox[3]))
+                    page_content.append({
+                        'type': 'table',
+                        'y_position': bbox[1],
+                        'data': rows
+                    })
+                if table_regions:
+                    # 过滤掉落在表格区域内的文本行，避免内容重复输出
+                    page_content = [
+                        c for c in page_content
+                        if c['type'] != 'text' or not any(
+                            y0 <= c['y_position'] <= y1 for y0, y1 in table_regions
+                        )
+                    ]
+                    page_content.sort(key=itemgetter('y_position'))
+            except Exception as table_error:
+                logger.warning("表格检测失败，回退到纯文本布局: %s", table_error)
+
+            # 预计算换行标记：相邻文本行的垂直距离用 numpy 一次性算出，
+            # 主线程的写入循环只需读取标记，不再逐行比较 bbox
+            text_items = [c for c in page_content if c['type'] == 'text']
+            if text_items:
+                ys = np.fromiter(
+                    (c['y_position'] for c in text_items),
+                    dtype=np.float32, count=len(text_items)
+                )
+                # 垂直距离小于 10 像素视为同一行的延续
+                breaks = np.empty(len(text_items), dtype=bool)
+                breaks[0] = True
+                np.greater_equal(np.abs(np.diff(ys)), 10, out=breaks[1:])
+                for content, is_break in zip(text_items, breaks):
+                    content['new_row'] = bool(is_break)
+
+            # 在线程内完成图片提取和尺寸计算
+            page_temp_files = []
+            for content in page_content:
+                if content['type'] != 'image':
+                    continue
+                img_data = content['data']
+                # 先确定目标尺寸，再提取图片，提取时可按需降采样
+                target_size = self._calculate_smart_excel_image_size(
+                    pdf_document, img_data['img'], img_data['page_num'], img_data['img_index'],
+                    options, img_data.get('bbox')
+                )
+                temp_img_path = self._extract_image_safely(
+                    pdf_document, img_data['img'], img_data['page_num'], img_data['img_index'],
+                    target_size, tmpdir
+                )
+                content['temp_path'] = temp_img_path
+                if temp_img_path:
+                    content['size'] = target_size
+                    page_temp_files.append(temp_img_path)
+
+            return page_num, page_content, page_width, page_temp_files
+        finally:
+            pdf_document.close()
+
     async def _pdf_to_pptx(
-        self, 
-        input_path: str, 
-        output_path: str, 
-        options: Optional[Dict[str, Any]] = None
+        self,
+        input_path: str,
+        output_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        pdf_bytes: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """PDF 转换为 PowerPoint 文档"""
         try:
-            from pptx import Presentation
-            from pptx.util import Inches
-            
             # 创建演示文稿
             prs = Presentation()
-            
-            # 使用 pdf2image 将 PDF 页面转换为图片
-            images = convert_from_path(input_path)
-            
+
+            # 使用 PyMuPDF 直接栅格化页面
+            # 避免 Poppler 子进程、中间 PPM 数据和 PIL 重编码
+            pdf_document = self._open_pdf(input_path, pdf_bytes)
+
             # 处理页面范围
-            if options and options.get('page_range'):
-                page_range = self._parse_page_range(options['page_range'])
-                images = [images[i-1] for i in page_range if 1 <= i <= len(images)]
-            
-            # 为每个页面创建幻灯片
-            for i, image in enumerate(images):
+            pages = self._get_pages_to_process(pdf_document, options)
+
+            quality = options.get('quality', 'medium') if options else 'medium'
+
+            # 为每个页面创建幻灯片（页码已在 _get_pages_to_process 中裁剪到有效范围）
+            for page_num in pages:
                 # 添加空白幻灯片
                 slide_layout = prs.slide_layouts[6]  # 空白布局
                 slide = prs.slides.add_slide(slide_layout)
-                
-                # 保存图片到临时文件
-                temp_image_file = tempfile.NamedTemporaryFile(suffix=f"_pdf_page_{i}.png", delete=False)
-                temp_image_path = temp_image_file.name
-                temp_image_file.close()
-                image.save(temp_image_path, 'PNG')
-                
-                # 添加图片到幻灯片
-                slide.shapes.add_picture(temp_image_path, 0, 0, prs.slide_width, prs.slide_height)
-                
-                # 清理临时文件
-                Path(temp_image_path).unlink(missing_ok=True)
-            
+
+                # 栅格化页面，PNG 字节留在内存中直接交给 pptx
+                page = pdf_document[page_num - 1]
+                zoom = self._get_raster_zoom(page, 150, quality)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+                # 添加图片到幻灯片（add_picture 接受文件对象，无需临时文件）
+                slide.shapes.add_picture(
+                    io.BytesIO(pix.tobytes("png")), 0, 0, prs.slide_width, prs.slide_height
+                )
+
+            pdf_document.close()
+
             # 保存演示文稿
             prs.save(output_path)
             
@@ -389,7 +957,7 @@ class PDFConverter:
             }
             
         except Exception as e:
-            logger.error(f"PDF 转 PowerPoint 失败: {e}")
+            logger.error("PDF 转 PowerPoint 失败: %s", e)
             return {
                 'success': False,
                 'error': f'PDF 转 PowerPoint 失败: {str(e)}'
@@ -404,8 +972,6 @@ class PDFConverter:
     ) -> Dict[str, Any]:
         """PDF 转换为图片"""
         try:
-            from pdf2image import convert_from_path
-            
             # 设置图片质量
             quality = options.get('quality', 'medium') if options else 'medium'
             if quality == 'high':
@@ -414,19 +980,28 @@ class PDFConverter:
                 dpi = 72
             else:
                 dpi = 150
-            
-            # 使用 pdf2image 转换
-            images = convert_from_path(input_path, dpi=dpi)
-            
-            # 处理页面范围
+
+            # 使用 PyMuPDF 直接栅格化（避免 Poppler 子进程和 PPM 中转）
+            pdf_document = fitz.open(input_path)
+
+            # 处理页面范围：该路径只输出一页，直接确定目标页，
+            # 不为大文档物化完整页码列表
             if options and options.get('page_range'):
                 page_range = self._parse_page_range(options['page_range'])
-                images = [images[i-1] for i in page_range if 1 <= i <= len(images)]
-            
+                first_page = next(
+                    (p for p in page_range if 1 <= p <= pdf_document.page_count), None
+                )
+            else:
+                first_page = 1 if pdf_document.page_count > 0 else None
+
             # 转换第一页（或指定页面）
-            if images:
-                image = images[0]
-                
+            if first_page:
+                page = pdf_document[first_page - 1]
+                zoom = self._get_raster_zoom(page, dpi, quality)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                pdf_document.close()
+
                 # 调整图片尺寸
                 if options and options.get('output_size') and options['output_size'] != 'original':
                     image = self._resize_image(image, options['output_size'])
@@ -459,35 +1034,62 @@ class PDFConverter:
                     'message': f'PDF 转 {target_format.upper()} 成功'
                 }
             else:
+                pdf_document.close()
                 return {
                     'success': False,
                     'error': 'PDF 文件为空或无法读取'
                 }
                 
         except Exception as e:
-            logger.error(f"PDF 转图片失败: {e}")
+            logger.error("PDF 转图片失败: %s", e)
             return {
                 'success': False,
                 'error': f'PDF 转图片失败: {str(e)}'
             }
     
-    def _extract_image_safely(self, pdf_document, image_info, page_num, img_index):
+    # 每个质量等级允许的最长边像素数，用于约束栅格化的像素预算
+    RASTER_MAX_EDGE_PX = {
+        'low': 1024,
+        'medium': 2048,
+        'high': 3072,
+    }
+
+    def _get_raster_zoom(self, page, dpi: int, quality: str = 'medium') -> float:
         """
-        安全地提取 PDF 中的图片
-        
+        计算栅格化缩放因子，按像素预算封顶
+
+        固定 DPI 对超大页面（如 A0 在 300 DPI 下约 12k x 17k 像素）
+        会分配数百 MB 的缓冲。以最长边的目标像素数为上限收缩缩放，
+        保证峰值内存与页面尺寸无关
+
+        Args:
+            page: PDF 页面对象
+            dpi: 期望的 DPI
+            quality: 质量等级（low/medium/high）
+
+        Returns:
+            缩放因子
+        """
+        max_edge_px = self.RASTER_MAX_EDGE_PX.get(quality, self.RASTER_MAX_EDGE_PX['medium'])
+        page_rect = page.rect
+        longest_pt = max(page_rect.width, page_rect.height) or 1
+        return min(dpi / 72, max_edge_px / longest_pt)
+
+    def _extract_image_bytes(self, pdf_document, image_info, page_num, img_index, target_size=None):
+        """
+        提取 PDF 中的图片为内存字节
+
         Args:
             pdf_document: PDF 文档对象
             image_info: 图片信息
             page_num: 页面编号
             img_index: 图片索引
-            
+            target_size: 目标 (宽, 高) 像素，明显小于原图时提取阶段先降采样
+
         Returns:
-            临时图片文件路径，如果失败返回 None
+            (图片字节, 扩展名) 元组，如果失败返回 None
         """
         try:
-            import fitz  # 确保导入 fitz 模块
-            import os
-            
             # 获取图片引用 - 处理不同的图片信息格式
             xref = None
             
@@ -510,52 +1112,108 @@ class PDFConverter:
                     pass
             
             if xref is None:
-                logger.warning(f"无法获取图片引用 (页面 {page_num}, 索引 {img_index})")
+                logger.warning("无法获取图片引用 (页面 %s, 索引 %s)", page_num, img_index)
                 return None
             
             # 确保 xref 是整数
             try:
                 xref = int(xref)
             except (ValueError, TypeError):
-                logger.warning(f"图片引用格式错误: {xref} (页面 {page_num}, 索引 {img_index})")
+                logger.warning("图片引用格式错误: %s (页面 %s, 索引 %s)", xref, page_num, img_index)
                 return None
             
-            # 创建 Pixmap 对象
+            # 优先原样提取嵌入的图片字节：
+            # JPEG/PNG 流直接落盘，跳过整个解码 + PNG 重编码过程
+            try:
+                base_image = pdf_document.extract_image(xref)
+            except Exception as extract_error:
+                logger.warning("提取原始图片字节失败，回退到 Pixmap: %s", extract_error)
+                base_image = None
+
+            if (base_image and base_image.get('ext') in ('jpg', 'jpeg', 'png')
+                    and base_image.get('colorspace', 0) < 4):
+                ext = base_image['ext']
+                img_bytes = base_image['image']
+
+                # 原图远大于目标尺寸时先降采样再落盘，
+                # 避免把多兆像素的缓冲原样塞进输出文档
+                if target_size:
+                    target_w, target_h = target_size
+                    raw_w = base_image.get('width', 0)
+                    raw_h = base_image.get('height', 0)
+                    if raw_w > target_w * 2 and raw_h > target_h * 2:
+                        try:
+                            with Image.open(io.BytesIO(img_bytes)) as pil_img:
+                                pil_img.thumbnail((target_w * 2, target_h * 2), Image.Resampling.LANCZOS)
+                                if pil_img.mode not in ('RGB', 'L'):
+                                    pil_img = pil_img.convert('RGB')
+                                buffer = io.BytesIO()
+                                pil_img.save(buffer, 'JPEG', quality=85)
+                            img_bytes = buffer.getvalue()
+                            ext = 'jpg'
+                        except Exception as resize_error:
+                            logger.warning("图片降采样失败，使用原始字节: %s", resize_error)
+
+                return img_bytes, ext
+
+            # 回退路径：CMYK/JPX 等特殊情况，经 Pixmap 解码再编码
             pix = fitz.Pixmap(pdf_document, xref)
-            
-            # 检查颜色空间
-            if pix.n - pix.alpha < 4:  # 灰度或 RGB
-                # 直接保存
-                temp_img_file = tempfile.NamedTemporaryFile(suffix=f"_pdf_img_{page_num}_{img_index}.png", delete=False)
-                temp_img_path = temp_img_file.name
-                temp_img_file.close()
-                pix.save(temp_img_path)
-            else:  # CMYK: 转换为 RGB
-                # 转换为 RGB 颜色空间
-                pix1 = fitz.Pixmap(fitz.csRGB, pix)
-                temp_img_file = tempfile.NamedTemporaryFile(suffix=f"_pdf_img_{page_num}_{img_index}.png", delete=False)
-                temp_img_path = temp_img_file.name
-                temp_img_file.close()
-                pix1.save(temp_img_path)
-                pix1 = None
-            
-            # 释放内存
-            pix = None
-            
-            # 验证文件是否成功创建
-            logger.info(f"尝试创建临时文件: {temp_img_path}")
-            if os.path.exists(temp_img_path) and os.path.getsize(temp_img_path) > 0:
-                logger.info(f"临时文件创建成功: {temp_img_path}")
-                return temp_img_path
+            try:
+                # 检查颜色空间
+                if pix.n - pix.alpha >= 4:  # CMYK: 原地重绑定为 RGB Pixmap
+                    pix = fitz.Pixmap(fitz.csRGB, pix)
+
+                return pix.tobytes('png'), 'png'
+            finally:
+                # del 立即递减引用计数，释放底层 C 缓冲
+                del pix
+
+        except Exception as e:
+            logger.warning("提取图片失败 (页面 %s, 索引 %s): %s", page_num, img_index, e)
+            return None
+
+    def _extract_image_safely(self, pdf_document, image_info, page_num, img_index, target_size=None, tmpdir=None):
+        """
+        安全地提取 PDF 中的图片到临时文件（需要磁盘路径的调用方使用）
+
+        Args:
+            pdf_document: PDF 文档对象
+            image_info: 图片信息
+            page_num: 页面编号
+            img_index: 图片索引
+            target_size: 目标 (宽, 高) 像素，明显小于原图时提取阶段先降采样
+            tmpdir: 会话临时目录（可选，文件直接写入该目录，由调用方统一清理）
+
+        Returns:
+            临时图片文件路径，如果失败返回 None
+        """
+        extracted = self._extract_image_bytes(
+            pdf_document, image_info, page_num, img_index, target_size
+        )
+        if extracted is None:
+            return None
+        img_bytes, ext = extracted
+
+        try:
+            # 会话目录内直接拼路径，省去 NamedTemporaryFile 的开销
+            if tmpdir:
+                temp_img_path = os.path.join(tmpdir, f"img_{page_num}_{img_index}.{ext}")
             else:
-                logger.warning(f"图片文件创建失败 (页面 {page_num}, 索引 {img_index})")
-                logger.warning(f"文件存在: {os.path.exists(temp_img_path)}")
-                if os.path.exists(temp_img_path):
-                    logger.warning(f"文件大小: {os.path.getsize(temp_img_path)}")
-                return None
-            
+                temp_file = tempfile.NamedTemporaryFile(
+                    suffix=f"_pdf_img_{page_num}_{img_index}.{ext}", delete=False
+                )
+                temp_file.close()
+                temp_img_path = temp_file.name
+
+            with open(temp_img_path, 'wb') as f:
+                f.write(img_bytes)
+
+            # 写入未抛异常即说明文件已生成，无需再 stat 验证
+            logger.info("临时文件创建成功: %s", temp_img_path)
+            return temp_img_path
+
         except Exception as e:
-            logger.warning(f"提取图片失败 (页面 {page_num}, 索引 {img_index}): {e}")
+            logger.warning("保存图片失败 (页面 %s, 索引 %s): %s", page_num, img_index, e)
             return None
 
     def _calculate_image_size(self, image_info, page_width, page_height):
@@ -571,7 +1229,6 @@ class PDFConverter:
             (width, height) 元组，单位为英寸
         """
         try:
-            from docx.shared import Inches
             
             # 默认图片大小
             default_width = 5.0  # 5 英寸
@@ -614,27 +1271,29 @@ class PDFConverter:
             return (default_width, default_height)
             
         except Exception as e:
-            logger.warning(f"计算图片大小时出错: {e}")
+            logger.warning("计算图片大小时出错: %s", e)
             return (5.0, 4.0)  # 返回默认大小
 
     def _calculate_smart_excel_image_size(
         self, 
-        pdf_document, 
-        image_info, 
-        page_num, 
-        img_index, 
-        options: Optional[Dict[str, Any]] = None
+        pdf_document,
+        image_info,
+        page_num,
+        img_index,
+        options: Optional[Dict[str, Any]] = None,
+        img_rect=None
     ) -> Tuple[int, int]:
         """
         智能计算 Excel 中图片的像素尺寸
-        
+
         Args:
             pdf_document: PDF 文档对象
             image_info: 图片信息
             page_num: 页面编号
             img_index: 图片索引
             options: 转换选项
-            
+            img_rect: 预先解析的图片边界框（可选，避免重复查询）
+
         Returns:
             (width, height) 元组，单位为像素
         """
@@ -644,15 +1303,16 @@ class PDFConverter:
             max_height = options.get('image_height', 200) if options else 200
             min_width = options.get('min_image_width', 50) if options else 50
             min_height = options.get('min_image_height', 30) if options else 30
-            
+
             # 获取页面信息
             page = pdf_document[page_num - 1]
             page_width = page.rect.width
             page_height = page.rect.height
-            
-            # 尝试获取图片在页面中的边界框
+
+            # 尝试获取图片在页面中的边界框（优先使用预解析结果）
             try:
-                img_rect = page.get_image_bbox(image_info)
+                if img_rect is None:
+                    img_rect = self._get_cached_image_bbox(page, image_info)
                 if img_rect:
                     img_x, img_y, img_w, img_h = img_rect
                     # 计算图片在页面中的相对位置和大小
@@ -679,20 +1339,20 @@ class PDFConverter:
                     target_width = max(min_width, target_width)
                     target_height = max(min_height, target_height)
                     
-                    logger.info(f"智能计算图片尺寸: 原始 {img_w}x{img_h}, 缩放为 {target_width}x{target_height}")
+                    logger.info("智能计算图片尺寸: 原始 %sx%s, 缩放为 %sx%s", img_w, img_h, target_width, target_height)
                     return target_width, target_height
                     
                 else:
                     # 如果无法获取边界框，使用默认计算
-                    logger.warning(f"无法获取图片边界框，使用默认尺寸")
+                    logger.warning("无法获取图片边界框，使用默认尺寸")
                     return self._calculate_default_excel_image_size(max_width, max_height, min_width, min_height)
                     
             except Exception as bbox_error:
-                logger.warning(f"获取图片边界框失败: {bbox_error}")
+                logger.warning("获取图片边界框失败: %s", bbox_error)
                 return self._calculate_default_excel_image_size(max_width, max_height, min_width, min_height)
             
         except Exception as e:
-            logger.warning(f"智能图片尺寸计算失败: {e}")
+            logger.warning("智能图片尺寸计算失败: %s", e)
             return 200, 150  # 返回默认尺寸
 
     def _calculate_default_excel_image_size(self, max_width, max_height, min_width, min_height):
@@ -715,56 +1375,65 @@ class PDFConverter:
             return width, height
             
         except Exception as e:
-            logger.warning(f"默认图片尺寸计算失败: {e}")
+            logger.warning("默认图片尺寸计算失败: %s", e)
             return 200, 150
 
-    def _collect_page_content(self, page, page_num, pdf_document, options):
+    def _collect_page_content(self, page, page_num, pdf_document, options, pdf_digest=None):
         """
         收集页面上的所有内容（文本和图片），按位置排序
-        
+
         Args:
             page: PDF 页面对象
             page_num: 页面编号
             pdf_document: PDF 文档对象
             options: 转换选项
-            
+            pdf_digest: PDF 字节摘要（可选，用于跨转换的页面缓存键）
+
         Returns:
             按位置排序的内容列表
         """
-        page_content = []
-        
         try:
             # 1. 收集文本内容
-            text_dict = page.get_text("dict")
-            for block in text_dict.get("blocks", []):
-                if "lines" in block:  # 文本块
-                    for line in block["lines"]:
-                        # 计算文本块的垂直位置
-                        if line["spans"]:
-                            first_span = line["spans"][0]
-                            bbox = first_span.get("bbox", [0, 0, 0, 0])
-                            y_position = bbox[1]  # 垂直位置
-                            
-                            # 收集行文本
-                            line_text = ""
-                            for span in line["spans"]:
-                                line_text += span["text"]
-                            
-                            if line_text.strip():
-                                page_content.append({
-                                    'type': 'text',
-                                    'y_position': y_position,
-                                    'data': line  # 存储完整的行数据，包含spans信息
-                                })
-            
+            # 列表推导一次构建，避免 append 路径上的多次几何扩容
+            text_dict = self._get_page_text_dict(page, page_num, pdf_digest, flags=TEXT_FLAGS)
+            page_content = [
+                {
+                    'type': 'text',
+                    # 垂直位置取首个 span 的 bbox
+                    'y_position': line["spans"][0].get("bbox", [0, 0, 0, 0])[1],
+                    'data': line  # 存储完整的行数据，包含spans信息
+                }
+                for block in text_dict.get("blocks", [])
+                if block.get("type") == 0 and "lines" in block  # 只处理文本块
+                for line in block["lines"]
+                if line["spans"]
+                # 行文本 join 为 C 实现，整行为空白时跳过
+                if (line_text := ''.join(s["text"] for s in line["spans"]))
+                and not line_text.isspace()
+            ]
+
+
             # 2. 收集图片内容
-            image_list = page.get_images()
+            image_list = self._get_page_images(page, pdf_digest)
             if image_list:
+                # 每页只解析一次图片边界框，后续尺寸/位置计算直接复用，
+                # 避免对内容流的重复扫描
+                bbox_by_index = {}
+                for img_index, img in enumerate(image_list):
+                    try:
+                        bbox_by_index[img_index] = self._get_cached_image_bbox(
+                            page, img, pdf_digest
+                        )
+                    except Exception as bbox_error:
+                        logger.warning("获取图片边界框失败: %s", bbox_error)
+                        bbox_by_index[img_index] = None
+
                 for img_index, img in enumerate(image_list):
                     try:
                         # 尝试获取图片在页面中的位置
-                        y_position = self._get_image_y_position(page, img, img_index)
-                        
+                        img_rect = bbox_by_index.get(img_index)
+                        y_position = self._get_image_y_position(page, img, img_index, img_rect)
+
                         page_content.append({
                             'type': 'image',
                             'y_position': y_position,
@@ -772,90 +1441,102 @@ class PDFConverter:
                                 'img': img,
                                 'img_index': img_index,
                                 'page_num': page_num,
-                                'y_position': y_position
+                                'y_position': y_position,
+                                'bbox': img_rect
                             }
                         })
                         
-                        logger.info(f"收集图片: 索引 {img_index}, 位置 Y={y_position}")
+                        logger.info("收集图片: 索引 %s, 位置 Y=%s", img_index, y_position)
                         
                     except Exception as img_error:
-                        logger.warning(f"收集图片失败: {img_error}")
+                        logger.warning("收集图片失败: %s", img_error)
                         continue
             
-            # 3. 按垂直位置排序
-            page_content.sort(key=lambda x: x['y_position'])
+            # 3. 按垂直位置排序（itemgetter 为 C 实现，排序键开销更低）
+            page_content.sort(key=itemgetter('y_position'))
             
-            logger.info(f"页面 {page_num} 收集到 {len(page_content)} 个内容项")
+            logger.info("页面 %s 收集到 %s 个内容项", page_num, len(page_content))
             
             return page_content
             
         except Exception as e:
-            logger.error(f"收集页面内容失败: {e}")
+            logger.error("收集页面内容失败: %s", e)
             return []
 
-    def _get_image_y_position(self, page, image_info, img_index):
+    def _get_image_y_position(self, page, image_info, img_index, img_rect=None):
         """
         获取图片在页面中的垂直位置
-        
+
         Args:
             page: PDF 页面对象
             image_info: 图片信息
             img_index: 图片索引
-            
+            img_rect: 预先解析的图片边界框（可选，避免重复查询）
+
         Returns:
             图片的垂直位置（Y坐标）
         """
         try:
-            # 尝试获取图片边界框
-            img_rect = page.get_image_bbox(image_info)
+            # 尝试获取图片边界框（优先使用预解析结果）
+            if img_rect is None:
+                img_rect = self._get_cached_image_bbox(page, image_info)
             if img_rect:
                 return img_rect[1]  # 返回Y坐标
             
             # 如果无法获取边界框，使用默认位置
             # 根据图片索引计算位置
-            page_height = page.rect.height
             default_y = 100 + img_index * 200  # 从顶部开始，每个图片间隔200像素
             
-            logger.warning(f"无法获取图片 {img_index} 的边界框，使用默认位置 Y={default_y}")
+            logger.warning("无法获取图片 %s 的边界框，使用默认位置 Y=%s", img_index, default_y)
             return default_y
             
         except Exception as e:
-            logger.warning(f"获取图片位置失败: {e}")
+            logger.warning("获取图片位置失败: %s", e)
             # 使用页面顶部位置
             return 100 + img_index * 200
 
+    def _get_span_font(self, font_name, font_size, span_flags, span_color):
+        """
+        获取 span 对应的 Excel Font 对象（按样式键缓存）
+
+        文本密集的 PDF 中同一样式会出现在成千上万个 span 上，
+        复用 Font 对象可避免重复构造和 openpyxl 的样式去重开销
+        """
+        bold = bool(span_flags & FLAG_BOLD)
+        italic = bool(span_flags & FLAG_ITALIC)
+        key = (font_name, font_size, bold, italic, span_color)
+
+        font = self._font_cache.get(key)
+        if font is None:
+            font = Font(name=font_name, size=font_size, bold=bold, italic=italic)
+
+            # 设置颜色
+            if span_color != 0:
+                rgb_color = _convert_color_tuple(span_color)
+                if rgb_color:
+                    try:
+                        font.color = Color(rgb=rgb_color)
+                    except Exception as color_error:
+                        logger.warning("设置字体颜色失败: %s", color_error)
+
+            self._font_cache[key] = font
+
+        return font
+
     def _get_excel_font(self, font_name: str):
         """获取 Excel 字体对象"""
         try:
-            from openpyxl.styles import Font
-            
-            # 字体映射
-            font_mapping = {
-                'Arial': 'Arial',
-                'Times': 'Times New Roman',
-                'Helvetica': 'Arial',
-                'Courier': 'Courier New',
-                'Calibri': 'Calibri',
-                'SimSun': 'SimSun',
-                'SimHei': 'SimHei',
-                'Microsoft YaHei': 'Microsoft YaHei'
-            }
-            
-            # 查找映射
-            excel_font_name = font_mapping.get(font_name, 'Arial')
-            
-            return Font(name=excel_font_name)
-            
+            # 查找映射（Font 对象按名称缓存复用，openpyxl 样式对象创建开销大）
+            excel_font_name = _EXCEL_FONT_MAPPING.get(font_name, 'Arial')
+            return _make_excel_font(excel_font_name)
+
         except Exception as e:
-            logger.warning(f"获取 Excel 字体失败: {e}")
-            from openpyxl.styles import Font
-            return Font(name='Arial')
+            logger.warning("获取 Excel 字体失败: %s", e)
+            return _make_excel_font('Arial')
 
     def _set_excel_cell_alignment(self, cell, bbox, page_width):
         """设置 Excel 单元格对齐方式"""
         try:
-            from openpyxl.styles import Alignment
-            
             if len(bbox) >= 4:
                 line_left = bbox[0]
                 line_right = bbox[2]
@@ -868,49 +1549,55 @@ class PDFConverter:
                 right_margin = (page_width - line_right) / page_width
                 center_offset = abs(line_center - page_center) / page_width
                 
-                # 设置对齐方式
+                # 计算水平对齐键，再取共享的 Alignment 对象
                 if center_offset < 0.08 and left_margin > 0.02 and right_margin > 0.02:
                     # 居中对齐
-                    cell.alignment = Alignment(horizontal='center')
+                    horizontal = 'center'
                 elif left_margin < 0.02 and right_margin > 0.05:
                     # 左对齐
-                    cell.alignment = Alignment(horizontal='left')
+                    horizontal = 'left'
                 elif right_margin < 0.02 and left_margin > 0.05:
                     # 右对齐
-                    cell.alignment = Alignment(horizontal='right')
+                    horizontal = 'right'
                 elif line_width > page_width * 0.75:
                     # 两端对齐
-                    cell.alignment = Alignment(horizontal='justify')
+                    horizontal = 'justify'
                 else:
                     # 默认左对齐
-                    cell.alignment = Alignment(horizontal='left')
+                    horizontal = 'left'
+
+                cell.alignment = _ALIGN_CACHE[horizontal]
             else:
-                cell.alignment = Alignment(horizontal='left')
+                cell.alignment = _ALIGN_CACHE['left']
                 
         except Exception as e:
-            logger.warning(f"设置 Excel 单元格对齐失败: {e}")
+            logger.warning("设置 Excel 单元格对齐失败: %s", e)
+
+    def _append_excel_row(self, ws, row_cells, font_size):
+        """整行追加单元格并设置行高，返回写入的行号"""
+        ws.append(row_cells)
+        row = ws._current_row
+        if font_size > 0:
+            self._set_excel_row_format(ws, row, font_size)
+        return row
+
+    def _advance_excel_rows(self, ws, count):
+        """追加空行以保留垂直间隔（图片高度、页面分隔），返回当前行号"""
+        for _ in range(count):
+            ws.append(())
+        return ws._current_row
 
     def _set_excel_row_format(self, ws, row, font_size):
         """设置 Excel 行格式"""
         try:
-            # 根据字体大小设置行高
-            if font_size >= 24:
-                row_height = 30
-            elif font_size >= 18:
-                row_height = 25
-            elif font_size >= 14:
-                row_height = 20
-            elif font_size >= 12:
-                row_height = 18
-            else:
-                row_height = 15
-            
-            ws.row_dimensions[row].height = row_height
-            
+            # 根据字体大小查表设置行高
+            ws.row_dimensions[row].height = _ROW_HEIGHTS[
+                bisect_right(_FONT_SIZE_THRESHOLDS, font_size)
+            ]
         except Exception as e:
-            logger.warning(f"设置 Excel 行格式失败: {e}")
+            logger.warning("设置 Excel 行格式失败: %s", e)
 
-    def _get_pages_to_process(self, pages, options: Optional[Dict[str, Any]] = None) -> List[int]:
+    def _get_pages_to_process(self, pages, options: Optional[Dict[str, Any]] = None) -> Sequence[int]:
         """获取需要处理的页面列表"""
         # 获取页面总数
         if hasattr(pages, 'page_count'):  # PyMuPDF 文档
@@ -919,146 +1606,151 @@ class PDFConverter:
             total_pages = len(pages)
         
         if not options or not options.get('page_range'):
-            return list(range(1, total_pages + 1))
-        
-        return self._parse_page_range(options['page_range'])
-    
+            # 直接返回 range 对象：下游只做迭代和 len，无需物化列表
+            return range(1, total_pages + 1)
+
+        # 在此处统一裁剪越界页码，下游循环无需再逐页做边界检查
+        return [
+            p for p in self._parse_page_range(options['page_range'])
+            if 1 <= p <= total_pages
+        ]
+
     def _parse_page_range(self, page_range: str) -> List[int]:
         """解析页面范围字符串"""
-        pages = []
-        parts = page_range.split(',')
-        
-        for part in parts:
-            part = part.strip()
-            if '-' in part:
-                start, end = map(int, part.split('-'))
-                pages.extend(range(start, end + 1))
+        # 一个正则同时匹配单页和区间，省去逐段 split/strip/分支
+        pages = set()
+
+        for start, end in _RANGE_TOKEN_RE.findall(page_range):
+            if end:
+                pages.update(range(int(start), int(end) + 1))
             else:
-                pages.append(int(part))
-        
-        return sorted(set(pages))  # 去重并排序
+                pages.add(int(start))
+
+        return sorted(pages)
     
     def _resize_image(self, image: Image.Image, output_size: str) -> Image.Image:
         """调整图片尺寸"""
         if output_size == 'A4':
-            # A4 尺寸: 210mm x 297mm, 300 DPI
-            target_width = int(210 * 300 / 25.4)  # mm to pixels
-            target_height = int(297 * 300 / 25.4)
+            target_width, target_height = _A4_SIZE_PX
         elif output_size == 'letter':
-            # Letter 尺寸: 8.5" x 11", 300 DPI
-            target_width = int(8.5 * 300)
-            target_height = int(11 * 300)
+            target_width, target_height = _LETTER_SIZE_PX
         else:
             return image
-        
+
+        # 远大于目标时先用 box 滤波快速整数倍缩小，
+        # 再对小得多的中间图做 LANCZOS，质量几乎不变但卷积量大幅减少
+        factor = min(image.width // target_width, image.height // target_height)
+        if factor >= 2:
+            image = image.reduce(factor)
+
         # 保持宽高比
         image.thumbnail((target_width, target_height), Image.Resampling.LANCZOS)
         return image
     
     def get_pdf_info(self, input_path: str) -> Dict[str, Any]:
         """获取 PDF 文件信息"""
+        # 优先用 PyMuPDF：page_count 直接读字段，页数查询 O(1)，
+        # 不像 PyPDF2 的 len(reader.pages) 需要遍历整个页面树
         try:
-            with PyPDF2.PdfReader(input_path) as reader:
+            with fitz.open(input_path) as doc:
                 return {
-                    'page_count': len(reader.pages),
+                    'page_count': doc.page_count,
                     'file_size': Path(input_path).stat().st_size,
-                    'is_encrypted': reader.is_encrypted,
-                    'metadata': reader.metadata
+                    'is_encrypted': doc.is_encrypted,
+                    'metadata': doc.metadata
                 }
+        except Exception as fitz_error:
+            logger.warning("PyMuPDF 读取 PDF 信息失败，回退到 PyPDF2: %s", fitz_error)
+
+        try:
+            reader = PyPDF2.PdfReader(input_path)
+            return {
+                'page_count': len(reader.pages),
+                'file_size': Path(input_path).stat().st_size,
+                'is_encrypted': reader.is_encrypted,
+                'metadata': reader.metadata
+            }
         except Exception as e:
-            logger.error(f"获取 PDF 信息失败: {e}")
+            logger.error("获取 PDF 信息失败: %s", e)
             return {}
     
     def _convert_color_to_rgb(self, color: int) -> Optional[tuple]:
-        """将 PDF 颜色值转换为 RGB 颜色元组"""
-        try:
-            # PDF 颜色通常是 24 位整数，格式为 0xRRGGBB
-            if color == 0:  # 黑色
-                return None
-            
-            # 提取 RGB 分量
-            r = (color >> 16) & 0xFF
-            g = (color >> 8) & 0xFF
-            b = color & 0xFF
-            
-            # 返回 RGB 元组
-            return (r, g, b)
-            
-        except Exception as e:
-            logger.warning(f"颜色转换失败: {e}")
-            return None
+        """将 PDF 颜色值转换为 RGB 颜色元组（结果按颜色值缓存）"""
+        return _convert_color_tuple(color)
     
     def _set_paragraph_alignment(self, paragraph, bbox, page_width):
         """设置段落对齐方式"""
-        try:
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            
-            if len(bbox) >= 4:
-                line_left = bbox[0]
-                line_right = bbox[2]
-                line_width = line_right - line_left
-                line_center = (line_left + line_right) / 2
-                page_center = page_width / 2
-                
-                # 计算对齐方式
-                left_margin = line_left / page_width
-                right_margin = (page_width - line_right) / page_width
-                center_offset = abs(line_center - page_center) / page_width
-                
+        # 快速路径：边界框信息不足时直接左对齐返回
+        if len(bbox) < 4:
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
+            return
 
-                
-                # 更精确的对齐判断
-                if center_offset < 0.08 and left_margin > 0.02 and right_margin > 0.02:
-                    # 非常接近页面中心，居中对齐
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    logger.info(f"设置居中对齐: 中心偏移={center_offset:.3f}")
-                elif left_margin < 0.02 and right_margin > 0.05:
-                    # 紧贴左边，左对齐
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                elif right_margin < 0.02 and left_margin > 0.05:
-                    # 紧贴右边，右对齐
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                elif line_width > page_width * 0.75:
-                    # 行宽超过页面75%，可能是两端对齐
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                elif center_offset < 0.12:
-                    # 接近中心，居中对齐
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                else:
-                    # 默认左对齐
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            else:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                logger.warning(f"边界框信息不足: {bbox}")
-                
-        except Exception as e:
-            logger.warning(f"设置段落对齐失败: {e}")
+        line_left = bbox[0]
+        line_right = bbox[2]
+        line_width = line_right - line_left
+        line_center = (line_left + line_right) / 2
+        page_center = page_width / 2
+
+        # 计算对齐方式
+        left_margin = line_left / page_width
+        right_margin = (page_width - line_right) / page_width
+        center_offset = abs(line_center - page_center) / page_width
+
+        # 更精确的对齐判断（纯算术不会抛异常，无需 try/except 包裹）
+        if center_offset < 0.08 and left_margin > 0.02 and right_margin > 0.02:
+            # 非常接近页面中心，居中对齐
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("设置居中对齐: 中心偏移=%.3f", center_offset)
+        elif left_margin < 0.02 and right_margin > 0.05:
+            # 紧贴左边，左对齐
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        elif right_margin < 0.02 and left_margin > 0.05:
+            # 紧贴右边，右对齐
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        elif line_width > page_width * 0.75:
+            # 行宽超过页面75%，可能是两端对齐
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        elif center_offset < 0.12:
+            # 接近中心，居中对齐
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        else:
+            # 默认左对齐
             paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
+    def _classify_alignments(self, bboxes, page_width):
+        """用 numpy 批量计算一组行的水平对齐方式
+
+        判定条件与 _set_paragraph_alignment 完全一致，返回的代码数组
+        按 _ALIGN_LOOKUP 下标取对应的 WD_ALIGN_PARAGRAPH 值
+        """
+        arr = np.asarray(bboxes, dtype=np.float32)
+        left_margin = arr[:, 0] / page_width
+        right_margin = (page_width - arr[:, 2]) / page_width
+        line_width = arr[:, 2] - arr[:, 0]
+        center_offset = np.abs((arr[:, 0] + arr[:, 2]) / 2 - page_width / 2) / page_width
+
+        return np.select(
+            [
+                (center_offset < 0.08) & (left_margin > 0.02) & (right_margin > 0.02),
+                (left_margin < 0.02) & (right_margin > 0.05),
+                (right_margin < 0.02) & (left_margin > 0.05),
+                line_width > page_width * 0.75,
+                center_offset < 0.12,
+            ],
+            [1, 0, 2, 3, 1],
+            default=0
+        )
+
     def _set_line_spacing(self, paragraph, font_size):
         """设置行间距"""
         try:
-            from docx.shared import Pt
-            
-            # 根据字体大小设置合适的行间距
-            if font_size >= 24:
-                # 超大字体，使用 1.8 倍行距
-                paragraph.paragraph_format.line_spacing = 1.8
-            elif font_size >= 18:
-                # 大字体，使用 1.5 倍行距
-                paragraph.paragraph_format.line_spacing = 1.5
-            elif font_size >= 14:
-                # 中等字体，使用 1.3 倍行距
-                paragraph.paragraph_format.line_spacing = 1.3
-            elif font_size >= 12:
-                # 标准字体，使用 1.2 倍行距
-                paragraph.paragraph_format.line_spacing = 1.2
-            else:
-                # 小字体，使用 1.1 倍行距
-                paragraph.paragraph_format.line_spacing = 1.1
-                
+            # 根据字体大小查表设置合适的行间距
+            paragraph.paragraph_format.line_spacing = _LINE_SPACINGS[
+                bisect_right(_FONT_SIZE_THRESHOLDS, font_size)
+            ]
         except Exception as e:
-            logger.warning(f"设置行间距失败: {e}")
+            logger.warning("设置行间距失败: %s", e)
             paragraph.paragraph_format.line_spacing = 1.2
 
     def _process_page_layout(self, doc, text_dict, page):
@@ -1073,16 +1765,19 @@ class PDFConverter:
             # 按垂直位置排序（从上到下）
             text_blocks.sort(key=lambda b: b.get("bbox", [0, 0, 0, 0])[1])
             
+            # 页面宽度只读一次，后续处理复用
+            page_width = page.rect.width
+
             # 分析文档结构
-            document_structure = self._analyze_document_structure(text_blocks, page.rect.width)
-            
+            document_structure = self._analyze_document_structure(text_blocks, page_width)
+
             # 处理文本块
             for block in text_blocks:
                 if "lines" in block:  # 文本块
-                    self._process_text_block(doc, block, document_structure, page.rect.width)
+                    self._process_text_block(doc, block, document_structure, page_width)
                     
         except Exception as e:
-            logger.error(f"处理页面布局失败: {e}")
+            logger.error("处理页面布局失败: %s", e)
 
     def _analyze_document_structure(self, text_blocks, page_width):
         """分析文档结构"""
@@ -1094,121 +1789,90 @@ class PDFConverter:
             'header_info': []  # 页眉信息
         }
         
+        # 第一遍扁平收集：所有 span 的字号进同一个数组（SoA），
+        # 每行的最大字号用 reduceat 一次性归约，避免逐 span 调 max
+        flat_lines = []
+        span_counts = []
+        span_sizes = []
         for block in text_blocks:
             if "lines" in block:
                 for line in block["lines"]:
-                    line_text = ""
-                    max_font_size = 0
-                    line_bbox = line.get("bbox", [0, 0, 0, 0])
-                    
-                    # 收集行文本和最大字体大小
-                    for span in line["spans"]:
-                        line_text += span["text"]
-                        max_font_size = max(max_font_size, span.get("size", 12))
-                    
-                    # 转换字体大小
-                    font_size = max(8, min(72, max_font_size * 0.75))
-                    
-                    # 分析行类型
-                    line_info = {
-                        'text': line_text.strip(),
-                        'bbox': line_bbox,
-                        'font_size': font_size,
-                        'block': block
-                    }
-                    
-                    # 根据字体大小和位置分类
-                    if font_size >= 20:
-                        structure['title_lines'].append(line_info)
-                    elif font_size >= 16:
-                        structure['subtitle_lines'].append(line_info)
-                    elif self._is_list_item(line_text):
-                        structure['list_items'].append(line_info)
-                    elif self._is_header_info(line_text, line_bbox, page_width):
-                        structure['header_info'].append(line_info)
-                    else:
-                        structure['body_lines'].append(line_info)
-        
+                    spans = line["spans"]
+                    flat_lines.append((line, block, spans))
+                    span_counts.append(len(spans))
+                    for span in spans:
+                        span_sizes.append(span.get("size", 12))
+
+        if not flat_lines:
+            return structure
+
+        counts = np.asarray(span_counts)
+        max_sizes = np.zeros(len(flat_lines), dtype=np.float32)
+        nonempty = counts > 0
+        if span_sizes:
+            sizes = np.asarray(span_sizes, dtype=np.float32)
+            # reduceat 的段起点只取非空行，空行的最大字号保持 0
+            starts = np.concatenate(([0], np.cumsum(counts)))[:-1]
+            max_sizes[nonempty] = np.maximum.reduceat(sizes, starts[nonempty])
+
+        # 转换字体大小（整列一次完成）
+        font_sizes = np.clip(max_sizes * 0.75, 8, 72)
+        is_title = font_sizes >= 20
+        is_subtitle = (font_sizes >= 16) & ~is_title
+
+        for idx, (line, block, spans) in enumerate(flat_lines):
+            # join 拼接行文本（C 实现，避免逐段 += 复制）
+            line_text = ''.join(span["text"] for span in spans)
+            line_bbox = line.get("bbox", [0, 0, 0, 0])
+
+            # 分析行类型
+            line_info = {
+                'text': line_text.strip(),
+                'bbox': line_bbox,
+                'font_size': float(font_sizes[idx]),
+                'block': block
+            }
+
+            # 根据字体大小和位置分类
+            if is_title[idx]:
+                structure['title_lines'].append(line_info)
+            elif is_subtitle[idx]:
+                structure['subtitle_lines'].append(line_info)
+            elif self._is_list_item(line_text):
+                structure['list_items'].append(line_info)
+            elif self._is_header_info(line_text, line_bbox, page_width):
+                structure['header_info'].append(line_info)
+            else:
+                structure['body_lines'].append(line_info)
+
         return structure
 
     def _is_list_item(self, text):
-        """判断是否为列表项"""
-        import re
-        # 匹配数字编号：1. 2. 3. 等
-        if re.match(r'^\d+\.', text.strip()):
-            return True
-        # 匹配字母编号：a. b. c. 等
-        if re.match(r'^[a-z]\.', text.strip()):
-            return True
-        # 匹配罗马数字：i. ii. iii. 等
-        if re.match(r'^[ivxlcdm]+\.', text.strip(), re.IGNORECASE):
-            return True
-        return False
+        """判断是否为列表项"""
+        text = text.strip()
+        # 数字编号（1. 2.）、字母编号（a. b.）、罗马数字（i. ii.）
+        return bool(
+            _LIST_NUM_RE.match(text)
+            or _LIST_ALPHA_RE.match(text)
+            or _LIST_ROMAN_RE.match(text)
+        )
 
     def _is_bullet_point(self, text):
         """判断是否为 bullet point"""
-        import re
-        
         # 去除首尾空格
         text = text.strip()
         if not text:
             return False
-        
-        # 常见的 bullet point 字符
-        bullet_chars = [
-            '•', '◦', '‣', '▪', '▫', '▸', '▹', '▻', '▽', '▾',
-            '-', '*', '+', '→', '⇒', '▶', '►', '▷', '◁', '◀',
-            '◆', '◇', '◈', '◉', '◎', '●', '○', '◐', '◑', '◒',
-            '◓', '◔', '◕', '◖', '◗', '◘', '◙', '◚', '◛', '◜',
-            '◝', '◞', '◟', '◠', '◡', '◢', '◣', '◤', '◥', '◦',
-            '◧', '◨', '◩', '◪', '◫', '◬', '◭', '◮', '◯', '◰',
-            '◱', '◲', '◳', '◴', '◵', '◶', '◷', '◸', '◹', '◺',
-            '◻', '◼', '◽', '◾', '◿', '☀', '☁', '☂', '☃', '☄',
-            '★', '☆', '☎', '☏', '☐', '☑', '☒', '☓', '☔', '☕',
-            '☖', '☗', '☘', '☙', '☚', '☛', '☜', '☝', '☞', '☟',
-            '☠', '☡', '☢', '☣', '☤', '☥', '☦', '☧', '☨', '☩',
-            '☪', '☫', '☬', '☭', '☮', '☯', '☰', '☱', '☲', '☳',
-            '☴', '☵', '☶', '☷', '☸', '☹', '☺', '☻', '☼', '☽',
-            '☾', '☿', '♀', '♂', '♁', '♂', '♃', '♄', '♅', '♆',
-            '♇', '♈', '♉', '♊', '♋', '♌', '♍', '♎', '♏', '♐',
-            '♑', '♒', '♓', '♔', '♕', '♖', '♗', '♘', '♙', '♚',
-            '♛', '♜', '♝', '♞', '♟', '♠', '♡', '♢', '♣', '♤',
-            '♥', '♦', '♧', '♨', '♩', '♪', '♫', '♬', '♭', '♮',
-            '♯', '♰', '♱', '♲', '♳', '♴', '♵', '♶', '♷', '♸',
-            '♹', '♺', '♻', '♼', '♽', '♾', '♿', '⚀', '⚁', '⚂',
-            '⚃', '⚄', '⚅', '⚆', '⚇', '⚈', '⚉', '⚊', '⚋', '⚌',
-            '⚍', '⚎', '⚏', '⚐', '⚑', '⚒', '⚓', '⚔', '⚕', '⚖',
-            '⚗', '⚘', '⚙', '⚚', '⚛', '⚜', '⚝', '⚞', '⚟', '⚠',
-            '⚡', '⚢', '⚣', '⚤', '⚥', '⚦', '⚧', '⚨', '⚩', '⚪',
-            '⚫', '⚬', '⚭', '⚮', '⚯', '⚰', '⚱', '⚲', '⚳', '⚴',
-            '⚵', '⚶', '⚷', '⚸', '⚹', '⚺', '⚻', '⚼', '⚽', '⚾',
-            '⚿', '⛀', '⛁', '⛂', '⛃', '⛄', '⛅', '⛆', '⛇', '⛈',
-            '⛉', '⛊', '⛋', '⛌', '⛍', '⛎', '⛏', '⛐', '⛑', '⛒',
-            '⛓', '⛔', '⛕', '⛖', '⛗', '⛘', '⛙', '⛚', '⛛', '⛜',
-            '⛝', '⛞', '⛟', '⛠', '⛡', '⛢', '⛣', '⛤', '⛥', '⛦',
-            '⛧', '⛨', '⛩', '⛪', '⛫', '⛬', '⛭', '⛮', '⛯', '⛰',
-            '⛱', '⛲', '⛳', '⛴', '⛵', '⛶', '⛷', '⛸', '⛹', '⛺',
-            '⛻', '⛼', '⛽', '⛾', '⛿'
-        ]
-        
-        # 检查第一个字符是否为 bullet point
-        if text and text[0] in bullet_chars:
+
+        # 检查第一个字符是否为 bullet point（O(1) 集合查找）
+        if text[0] in _BULLET_CHARS:
             return True
         
-        # 检查常见的 bullet point 模式
-        bullet_patterns = [
-            r'^[•◦‣▪▫▸▹▻▽▾→⇒▶►▷◁◀◆◇◈◉◎●○◐◑◒◓◔◕◖◗◘◙◚◛◜◝◞◟◠◡◢◣◤◥◦◧◨◩◪◫◬◭◮◯◰◱◲◳◴◵◶◷◸◹◺◻◼◽◾◿☀☁☂☃☄★☆☎☏☐☑☒☓☔☕☖☗☘☙☚☛☜☝☞☟☠☡☢☣☤☥☦☧☨☩☪☫☬☭☮☯☰☱☲☳☴☵☶☷☸☹☺☻☼☽☾☿♀♂♁♂♃♄♅♆♇♈♉♊♋♌♍♎♏♐♑♒♓♔♕♖♗♘♙♚♛♜♝♞♟♠♡♢♣♤♥♦♧♨♩♪♫♬♭♮♯♰♱♲♳♴♵♶♷♸♹♺♻♼♽♾♿⚀⚁⚂⚃⚄⚅⚆⚇⚈⚉⚊⚋⚌⚍⚎⚏⚐⚑⚒⚓⚔⚕⚖⚗⚘⚙⚚⚛⚜⚝⚞⚟⚠⚡⚢⚣⚤⚥⚦⚧⚨⚩⚪⚫⚬⚭⚮⚯⚰⚱⚲⚳⚴⚵⚶⚷⚸⚹⚺⚻⚼⚽⚾⚿⛀⛁⛂⛃⛄⛅⛆⛇⛈⛉⛊⛋⛌⛍⛎⛏⛐⛑⛒⛓⛔⛕⛖⛗⛘⛙⛚⛛⛜⛝⛞⛟⛠⛡⛢⛣⛤⛥⛦⛧⛨⛩⛪⛫⛬⛭⛮⛯⛰⛱⛲⛳⛴⛵⛶⛷⛸⛹⛺⛻⛼⛽⛾⛿]\s+',  # 各种 bullet 字符后跟空格
-            r'^[-*+]\s+',  # 常见的 bullet 字符
-            r'^[→⇒▶►▷◁◀]\s+',  # 箭头类 bullet
-            r'^[◆◇◈◉◎●○]\s+',  # 圆形类 bullet
-            r'^[★☆]\s+',  # 星形类 bullet
-            r'^[☐☑☒]\s+',  # 复选框类 bullet
-        ]
-        
-        for pattern in bullet_patterns:
-            if re.match(pattern, text):
+        # 检查常见的 bullet point 模式（正则已在模块加载时预编译）
+        for pattern in _BULLET_PATTERNS:
+            if pattern.match(text):
                 return True
-        
+
         return False
 
     def _is_header_info(self, text, bbox, page_width):
@@ -1217,9 +1881,7 @@ class PDFConverter:
         if len(bbox) >= 4 and bbox[1] < 100:  # 距离顶部小于100像素
             return True
         # 检查是否包含文档编号或日期
-        if any(keyword in text.lower() for keyword in ['a/inb', 'geneva', 'november', 'december']):
-            return True
-        return False
+        return _HEADER_RE.search(text) is not None
 
     def _process_text_block(self, doc, block, structure, page_width):
         """处理文本块"""
@@ -1227,14 +1889,10 @@ class PDFConverter:
             # 收集所有行
             lines = []
             for line in block["lines"]:
-                line_text = ""
                 line_bbox = line.get("bbox", [0, 0, 0, 0])
-                
-                # 收集行文本
-                for span in line["spans"]:
-                    line_text += span["text"]
-                
-                line_text = line_text.strip()
+
+                # 收集行文本（join 保证 O(n) 拼接）
+                line_text = ''.join(span["text"] for span in line["spans"]).strip()
                 if not line_text:
                     continue
                 
@@ -1248,14 +1906,25 @@ class PDFConverter:
             
             # 智能合并相关行
             merged_lines = self._merge_bullet_point_lines(lines)
-            
+
+            # 批量预分类对齐方式：所有行的 bbox 一次进 numpy，
+            # 行循环内只剩一次查表赋值
+            if merged_lines:
+                align_codes = self._classify_alignments(
+                    [
+                        li['bbox'] if len(li['bbox']) >= 4 else (0, 0, 0, 0)
+                        for li in merged_lines
+                    ],
+                    page_width
+                )
+
             # 处理合并后的行
-            for line_info in merged_lines:
+            for line_idx, line_info in enumerate(merged_lines):
                 # 创建段落
                 paragraph = doc.add_paragraph()
-                
-                # 设置段落对齐方式
-                self._set_paragraph_alignment(paragraph, line_info['bbox'], page_width)
+
+                # 设置段落对齐方式（代码已批量算好）
+                paragraph.alignment = _ALIGN_LOOKUP[align_codes[line_idx]]
                 
                 # 处理列表项和 bullet points 缩进
                 if line_info['is_list']:
@@ -1265,7 +1934,6 @@ class PDFConverter:
                 
                 # 处理行中的每个 span
                 max_font_size = 0
-                from docx.shared import Pt
                 for span in line_info['spans']:
                     # 获取文本和样式信息
                     text = span["text"]
@@ -1276,27 +1944,24 @@ class PDFConverter:
                     font_size = max(8, min(72, raw_font_size * 0.75))
                     max_font_size = max(max_font_size, font_size)
                     
-                    # 改进的样式检测
-                    is_bold = "Bold" in pdf_font_name or span.get("flags", 0) & 2**4
-                    is_italic = "Italic" in pdf_font_name or span.get("flags", 0) & 2**1
-                    
-                    # 通过字体大小检测标题样式
-                    if font_size >= 24:
-                        is_bold = True
-                    
-                    # 通过字体名称特征检测
-                    font_lower = pdf_font_name.lower()
-                    if any(keyword in font_lower for keyword in ['bold', 'heavy', 'black', 'extra']):
-                        is_bold = True
-                    if any(keyword in font_lower for keyword in ['italic', 'oblique']):
-                        is_italic = True
+                    # 改进的样式检测：一次位掩码 + 一次正则扫描覆盖所有特征
+                    span_flags = span.get("flags", 0)
+                    is_bold = bool(
+                        span_flags & FLAG_BOLD
+                        or font_size >= 24  # 大字号视为标题加粗
+                        or _BOLD_FONT_RE.search(pdf_font_name)
+                    )
+                    is_italic = bool(
+                        span_flags & FLAG_ITALIC
+                        or _ITALIC_FONT_RE.search(pdf_font_name)
+                    )
                     
-                    if text.strip():
+                    if text and not text.isspace():
                         # 添加运行到段落
                         run = paragraph.add_run(text)
                         
                         # 应用字体样式
-                        word_font_name = self._get_font_mapping(pdf_font_name)
+                        word_font_name = _map_pdf_font(pdf_font_name)
                         run.font.name = word_font_name
                         run.font.size = Pt(font_size)
                         run.bold = is_bold
@@ -1306,13 +1971,12 @@ class PDFConverter:
                         if "color" in span:
                             color = span["color"]
                             if color != 0:  # 不是黑色
-                                rgb_color = self._convert_color_to_rgb(color)
+                                rgb_color = _convert_color_tuple(color)
                                 if rgb_color:
                                     try:
-                                        from docx.shared import RGBColor
-                                        run.font.color.rgb = RGBColor(*rgb_color)
+                                        run.font.color.rgb = _make_rgb_color(color)
                                     except Exception as color_error:
-                                        logger.warning(f"设置字体颜色失败: {color_error}")
+                                        logger.warning("设置字体颜色失败: %s", color_error)
                 
                 # 设置行间距
                 self._set_line_spacing(paragraph, max_font_size)
@@ -1321,12 +1985,11 @@ class PDFConverter:
                 self._set_advanced_formatting(paragraph, line_bbox, page_width, max_font_size)
                 
         except Exception as e:
-            logger.error(f"处理文本块失败: {e}")
+            logger.error("处理文本块失败: %s", e)
 
     def _set_list_item_format(self, paragraph, bbox, page_width):
         """设置列表项格式"""
         try:
-            from docx.shared import Inches
             
             if len(bbox) >= 4:
                 # 计算缩进
@@ -1341,12 +2004,11 @@ class PDFConverter:
                     paragraph.paragraph_format.left_indent = Inches(left_margin / 72)
                     
         except Exception as e:
-            logger.warning(f"设置列表项格式失败: {e}")
+            logger.warning("设置列表项格式失败: %s", e)
 
     def _set_bullet_point_format(self, paragraph, bbox, page_width):
         """设置 bullet point 格式"""
         try:
-            from docx.shared import Inches
             
             if len(bbox) >= 4:
                 # 计算缩进
@@ -1363,12 +2025,11 @@ class PDFConverter:
                     paragraph.paragraph_format.first_line_indent = Inches(-0.25)
                 
                 # 设置段落间距，让 bullet points 更紧凑
-                from docx.shared import Pt
                 paragraph.paragraph_format.space_after = Pt(6)
                 paragraph.paragraph_format.space_before = Pt(0)
                     
         except Exception as e:
-            logger.warning(f"设置 bullet point 格式失败: {e}")
+            logger.warning("设置 bullet point 格式失败: %s", e)
 
     def _merge_bullet_point_lines(self, lines):
         """智能合并 bullet point 行"""
@@ -1428,29 +2089,25 @@ class PDFConverter:
         if len(line_group) == 1:
             return line_group[0]
         
-        # 合并多行
-        merged_text = ""
-        merged_spans = []
-        merged_bbox = line_group[0]['bbox'].copy()
-        
-        for i, line in enumerate(line_group):
-            # 添加行文本
-            if i > 0:
-                merged_text += " "  # 行间添加空格
-            merged_text += line['text']
-            
-            # 合并 spans
-            merged_spans.extend(line['spans'])
-            
-            # 更新边界框
-            if len(line['bbox']) >= 4 and len(merged_bbox) >= 4:
-                merged_bbox[2] = max(merged_bbox[2], line['bbox'][2])  # 右边界
-                merged_bbox[3] = max(merged_bbox[3], line['bbox'][3])  # 下边界
-        
+        # 合并多行：文本 join、spans 用 chain 展开，
+        # 边界框右/下边界用标量局部变量单次遍历求出
+        merged_bbox = list(line_group[0]['bbox'])
+        if len(merged_bbox) >= 4:
+            max_x, max_y = merged_bbox[2], merged_bbox[3]
+            for line in line_group[1:]:
+                bbox = line['bbox']
+                if len(bbox) >= 4:
+                    if bbox[2] > max_x:
+                        max_x = bbox[2]
+                    if bbox[3] > max_y:
+                        max_y = bbox[3]
+            merged_bbox[2] = max_x  # 右边界
+            merged_bbox[3] = max_y  # 下边界
+
         return {
-            'text': merged_text,
+            'text': " ".join(line['text'] for line in line_group),
             'bbox': merged_bbox,
-            'spans': merged_spans,
+            'spans': list(chain.from_iterable(line['spans'] for line in line_group)),
             'is_bullet': line_group[0]['is_bullet'],
             'is_list': line_group[0]['is_list']
         }
@@ -1458,7 +2115,6 @@ class PDFConverter:
     def _set_advanced_formatting(self, paragraph, bbox, page_width, font_size):
         """设置高级格式（包括负缩进等）"""
         try:
-            from docx.shared import Inches, Pt
             
             if len(bbox) >= 4:
                 left_margin = bbox[0]
@@ -1475,155 +2131,84 @@ class PDFConverter:
                     right_indent = page_width - right_margin
                     paragraph.paragraph_format.right_indent = Inches(right_indent / 72)
                 
-                # 根据字体大小设置段落间距
-                if font_size >= 20:
-                    paragraph.paragraph_format.space_after = Pt(12)
-                elif font_size >= 16:
-                    paragraph.paragraph_format.space_after = Pt(8)
-                else:
-                    paragraph.paragraph_format.space_after = Pt(6)
+                # 根据字体大小查表设置段落间距
+                paragraph.paragraph_format.space_after = _ADV_SPACE_AFTER_PTS[
+                    bisect_right(_ADV_THRESHOLDS, font_size)
+                ]
                     
         except Exception as e:
-            logger.warning(f"设置高级格式失败: {e}")
+            logger.warning("设置高级格式失败: %s", e)
 
     def _set_paragraph_spacing(self, paragraph, font_size):
         """设置段落间距"""
         try:
-            from docx.shared import Pt
-            
-            # 根据字体大小设置段落间距
-            if font_size >= 24:
-                # 超大字体，使用较大段落间距
-                paragraph.paragraph_format.space_after = Pt(16)
-                paragraph.paragraph_format.space_before = Pt(8)
-            elif font_size >= 18:
-                # 大字体，使用较大段落间距
-                paragraph.paragraph_format.space_after = Pt(12)
-                paragraph.paragraph_format.space_before = Pt(6)
-            elif font_size >= 14:
-                # 中等字体，使用中等段落间距
-                paragraph.paragraph_format.space_after = Pt(8)
-                paragraph.paragraph_format.space_before = Pt(4)
-            elif font_size >= 12:
-                # 标准字体，使用标准段落间距
-                paragraph.paragraph_format.space_after = Pt(6)
-                paragraph.paragraph_format.space_before = Pt(2)
-            else:
-                # 小字体，使用较小段落间距
-                paragraph.paragraph_format.space_after = Pt(4)
-                paragraph.paragraph_format.space_before = Pt(1)
-                
+            # 根据字体大小查表设置段落间距（Pt 对象为预构建常量）
+            idx = bisect_right(_FONT_SIZE_THRESHOLDS, font_size)
+            paragraph.paragraph_format.space_after = _SPACE_AFTER_PTS[idx]
+            paragraph.paragraph_format.space_before = _SPACE_BEFORE_PTS[idx]
         except Exception as e:
-            logger.warning(f"设置段落间距失败: {e}")
-            paragraph.paragraph_format.space_after = Pt(6)
+            logger.warning("设置段落间距失败: %s", e)
+            paragraph.paragraph_format.space_after = _SPACE_AFTER_PTS[1]
 
     def _get_font_mapping(self, pdf_font_name: str) -> str:
         """获取字体映射，将 PDF 字体名映射到 Word 字体名"""
-        font_mapping = {
-            # 常见字体映射
-            'Arial': 'Arial',
-            'Arial-Bold': 'Arial',
-            'Arial-Italic': 'Arial',
-            'Arial-BoldItalic': 'Arial',
-            'ArialMT': 'Arial',
-            'Arial-BoldMT': 'Arial',
-            'Times': 'Times New Roman',
-            'Times-Bold': 'Times New Roman',
-            'Times-Italic': 'Times New Roman',
-            'Times-BoldItalic': 'Times New Roman',
-            'TimesNewRomanPSMT': 'Times New Roman',
-            'TimesNewRomanPS-BoldMT': 'Times New Roman',
-            'Helvetica': 'Arial',
-            'Helvetica-Bold': 'Arial',
-            'Helvetica-Italic': 'Arial',
-            'Helvetica-BoldItalic': 'Arial',
-            'Courier': 'Courier New',
-            'Courier-Bold': 'Courier New',
-            'Courier-Italic': 'Courier New',
-            'Courier-BoldItalic': 'Courier New',
-            'SimSun': 'SimSun',
-            'SimHei': 'SimHei',
-            'Microsoft YaHei': 'Microsoft YaHei',
-            'KaiTi': 'KaiTi',
-            'FangSong': 'FangSong',
-            # 添加 FranklinGothic 字体映射
-            'FranklinGothic-Book': 'Arial',
-            'FranklinGothic': 'Arial',
-            'Franklin': 'Arial',
-            'Calibri': 'Calibri',
-            'Calibri-Bold': 'Calibri',
-            'Calibri-Italic': 'Calibri',
-        }
-        
-        # 清理字体名
-        clean_font_name = pdf_font_name.split('+')[-1]  # 移除字体子集前缀
-        
-        # 查找映射
-        for pdf_font, word_font in font_mapping.items():
-            if pdf_font.lower() in clean_font_name.lower():
-                return word_font
-        
-        # 如果没有找到映射，根据字体特征推断
-        clean_font_lower = clean_font_name.lower()
-        if 'times' in clean_font_lower or 'roman' in clean_font_lower:
-            return 'Times New Roman'
-        elif 'arial' in clean_font_lower or 'helvetica' in clean_font_lower:
-            return 'Arial'
-        elif 'courier' in clean_font_lower or 'mono' in clean_font_lower:
-            return 'Courier New'
-        elif 'calibri' in clean_font_lower:
-            return 'Calibri'
-        else:
-            # 默认使用 Arial
-            return 'Arial' 
+        return _map_pdf_font(pdf_font_name)
 
     def _process_page_layout_optimized(self, doc, text_dict, page):
         """基于参考文档分析的优化布局处理"""
         try:
+            # 页面宽度只读一次，后续处理复用
+            page_width = page.rect.width
+
             # 收集所有文本行，保持原始顺序
             all_lines = []
-            
+
             for block in text_dict.get("blocks", []):
                 if "lines" in block:  # 文本块
                     for line in block["lines"]:
-                        line_info = self._extract_line_info(line, block, page.rect.width)
+                        line_info = self._extract_line_info(line, block, page_width)
                         if line_info:
                             all_lines.append(line_info)
-            
+
             # 按垂直位置排序（从上到下，从左到右）
-            all_lines.sort(key=lambda x: (x['bbox'][1], x['bbox'][0]))
-            
+            # (y, x) 键先装入 numpy 数组，lexsort 在 C 层完成比较
+            if len(all_lines) > 1:
+                n_lines = len(all_lines)
+                ys = np.fromiter((l['bbox'][1] for l in all_lines), dtype=np.float32, count=n_lines)
+                xs = np.fromiter((l['bbox'][0] for l in all_lines), dtype=np.float32, count=n_lines)
+                order = np.lexsort((xs, ys))
+                all_lines = [all_lines[i] for i in order.tolist()]
+
             # 智能合并相关行（如标题的多行）
             merged_lines = self._merge_related_lines(all_lines)
-            
+
             # 分析文档结构
-            structure = self._analyze_document_structure_optimized(merged_lines, page.rect.width)
-            
+            structure = self._analyze_document_structure_optimized(merged_lines, page_width)
+
             # 处理每一行
             for line_info in merged_lines:
-                self._process_line_optimized(doc, line_info, structure, page.rect.width)
+                self._process_line_optimized(doc, line_info, structure, page_width)
                     
         except Exception as e:
-            logger.error(f"优化布局处理失败: {e}")
+            logger.error("优化布局处理失败: %s", e)
 
     def _extract_line_info(self, line, block, page_width):
         """提取行信息"""
         try:
-            line_text = ""
             line_bbox = line.get("bbox", [0, 0, 0, 0])
             max_font_size = 0
             is_bold = False
             font_name = "Arial"
-            
-            # 收集行文本和样式信息
+
+            # 行文本用 join 拼接，样式信息仍逐 span 收集
+            line_text = ''.join(span["text"] for span in line["spans"])
             for span in line["spans"]:
-                line_text += span["text"]
                 span_size = span.get("size", 12)
                 max_font_size = max(max_font_size, span_size)
                 
                 # 检测粗体
                 span_flags = span.get("flags", 0)
-                if span_flags & 2**4:  # 粗体标志
+                if span_flags & FLAG_BOLD:  # 粗体标志
                     is_bold = True
                 
                 # 获取字体名
@@ -1640,6 +2225,7 @@ class PDFConverter:
             
             return {
                 'text': line_text,
+                'text_lower': line_text.lower(),  # 缓存小写副本，下游判断复用
                 'bbox': line_bbox,
                 'font_size': font_size,
                 'is_bold': is_bold,
@@ -1649,7 +2235,7 @@ class PDFConverter:
             }
             
         except Exception as e:
-            logger.warning(f"提取行信息失败: {e}")
+            logger.warning("提取行信息失败: %s", e)
             return None
 
     def _merge_related_lines(self, all_lines):
@@ -1697,8 +2283,10 @@ class PDFConverter:
         both_bold = line1['is_bold'] and line2['is_bold']
         
         # 检查是否包含标题关键词
-        title_keywords = ['meeting', 'negotiating', 'body', 'convention', 'agreement', 'international', 'instrument', 'pandemic', 'prevention', 'preparedness', 'response']
-        has_title_keywords = any(keyword in line1['text'].lower() for keyword in title_keywords) or any(keyword in line2['text'].lower() for keyword in title_keywords)
+        has_title_keywords = bool(
+            _TITLE_KEYWORD_RE.search(line1['text'])
+            or _TITLE_KEYWORD_RE.search(line2['text'])
+        )
         
         # 合并条件：垂直距离小、字体大小相似、都是粗体、包含标题关键词
         if y_diff < 30 and font_size_diff < 2 and both_bold and has_title_keywords:
@@ -1718,27 +2306,35 @@ class PDFConverter:
         """合并行组"""
         if len(line_group) == 1:
             return line_group[0]
-        
-        # 合并文本
-        merged_text = " ".join(line['text'] for line in line_group)
-        
+
+        # 单次遍历同时累积文本片段、边界框极值和 spans
+        first = line_group[0]
+        first_bbox = first['bbox']
+        min_x, min_y, max_x, max_y = first_bbox[0], first_bbox[1], first_bbox[2], first_bbox[3]
+        texts = [first['text']]
+        spans = list(first['spans'])
+        for line in line_group[1:]:
+            texts.append(line['text'])
+            bbox = line['bbox']
+            if bbox[0] < min_x:
+                min_x = bbox[0]
+            if bbox[1] < min_y:
+                min_y = bbox[1]
+            if bbox[2] > max_x:
+                max_x = bbox[2]
+            if bbox[3] > max_y:
+                max_y = bbox[3]
+            spans.extend(line['spans'])
+
+        merged_text = " ".join(texts)
+
         # 使用第一行的基本信息
-        merged_line = line_group[0].copy()
+        merged_line = first.copy()
         merged_line['text'] = merged_text
-        
-        # 更新边界框
-        min_x = min(line['bbox'][0] for line in line_group)
-        min_y = min(line['bbox'][1] for line in line_group)
-        max_x = max(line['bbox'][2] for line in line_group)
-        max_y = max(line['bbox'][3] for line in line_group)
+        merged_line['text_lower'] = merged_text.lower()
         merged_line['bbox'] = [min_x, min_y, max_x, max_y]
-        
-        # 合并spans
-        all_spans = []
-        for line in line_group:
-            all_spans.extend(line['spans'])
-        merged_line['spans'] = all_spans
-        
+        merged_line['spans'] = spans
+
         return merged_line
 
     def _analyze_document_structure_optimized(self, all_lines, page_width):
@@ -1752,38 +2348,90 @@ class PDFConverter:
             'footer_info': []       # 页脚信息
         }
         
-        for line_info in all_lines:
+        if not all_lines:
+            return structure
+
+        # SoA：把数值特征装入 numpy 数组，便宜的数值判断批量算完，
+        # 正则类判断只对未被数值掩码命中的行退化为逐行检查
+        n_lines = len(all_lines)
+        font_sizes = np.fromiter((l['font_size'] for l in all_lines), dtype=np.float32, count=n_lines)
+        bold_flags = np.fromiter((bool(l['is_bold']) for l in all_lines), dtype=np.bool_, count=n_lines)
+        y0 = np.fromiter(
+            (l['bbox'][1] if len(l['bbox']) >= 4 else np.inf for l in all_lines),
+            dtype=np.float32, count=n_lines,
+        )
+        y1 = np.fromiter(
+            (l['bbox'][3] if len(l['bbox']) >= 4 else -np.inf for l in all_lines),
+            dtype=np.float32, count=n_lines,
+        )
+
+        title_mask = (font_sizes >= 18) & bold_flags
+        subtitle_mask = (font_sizes >= 14) & bold_flags
+        header_mask = y0 < 100
+        footer_mask = y1 > 700  # 假设页面高度约800
+
+        for idx, line_info in enumerate(all_lines):
             text = line_info['text']
-            bbox = line_info['bbox']
-            font_size = line_info['font_size']
-            is_bold = line_info['is_bold']
-            
-            # 基于参考文档的特征分析
-            if self._is_document_title(text, bbox, font_size, is_bold):
+
+            # 基于参考文档的特征分析（数值掩码优先，关键词只扫一趟）
+            # 分类结果缓存在 line_info['category']，格式化阶段直接复用
+            title_hit, section_hit, list_hit, header_hit = _scan_keywords(text)
+            stripped = text.strip()
+
+            if title_mask[idx] or title_hit:
+                line_info['category'] = 'title'
                 structure['title_lines'].append(line_info)
-            elif self._is_section_title(text, bbox, font_size, is_bold):
+            elif subtitle_mask[idx] or section_hit:
+                line_info['category'] = 'subtitle'
                 structure['subtitle_lines'].append(line_info)
-            elif self._is_list_item_optimized(text, bbox, font_size):
+            elif list_hit or _LIST_PREFIX_RE.match(stripped) or stripped.startswith(('•', '-')):
+                line_info['category'] = 'list'
                 structure['list_items'].append(line_info)
-            elif self._is_header_info_optimized(text, bbox, page_width):
+            elif header_mask[idx] or header_hit:
+                line_info['category'] = 'header'
                 structure['header_info'].append(line_info)
-            elif self._is_footer_info(text, bbox, page_width):
+            elif footer_mask[idx] or (len(text) > 100 and stripped.startswith('1 ')):
+                line_info['category'] = 'footer'
                 structure['footer_info'].append(line_info)
             else:
+                line_info['category'] = 'body'
                 structure['body_lines'].append(line_info)
-        
+
         return structure
 
+    def _classify_line(self, line_info, page_width):
+        """单趟行分类：数值特征加一次合并关键词扫描，返回类别字符串
+
+        判定顺序与 _analyze_document_structure_optimized 完全一致
+        """
+        text = line_info['text']
+        bbox = line_info['bbox']
+        font_size = line_info['font_size']
+        is_bold = line_info['is_bold']
+
+        title_hit, section_hit, list_hit, header_hit = _scan_keywords(text)
+        stripped = text.strip()
+        has_bbox = len(bbox) >= 4
+
+        if (font_size >= 18 and is_bold) or title_hit:
+            return 'title'
+        if (font_size >= 14 and is_bold) or section_hit:
+            return 'subtitle'
+        if list_hit or _LIST_PREFIX_RE.match(stripped) or stripped.startswith(('•', '-')):
+            return 'list'
+        if (has_bbox and bbox[1] < 100) or header_hit:
+            return 'header'
+        if (has_bbox and bbox[3] > 700) or (len(text) > 100 and stripped.startswith('1 ')):
+            return 'footer'
+        return 'body'
+
     def _is_document_title(self, text, bbox, font_size, is_bold):
         """判断是否为文档标题"""
         # 基于参考文档的特征
         if font_size >= 18 and is_bold:
             return True
         # 检查是否包含特定关键词
-        title_keywords = ['meeting', 'negotiating', 'body', 'convention', 'agreement', 'international', 'instrument', 'pandemic', 'prevention', 'preparedness', 'response']
-        if any(keyword in text.lower() for keyword in title_keywords):
-            return True
-        return False
+        return _TITLE_KEYWORD_RE.search(text) is not None
 
     def _is_section_title(self, text, bbox, font_size, is_bold):
         """判断是否为章节标题"""
@@ -1791,32 +2439,17 @@ class PDFConverter:
         if font_size >= 14 and is_bold:
             return True
         # 检查是否包含特定关键词
-        section_keywords = ['agenda', 'provisional', 'opening', 'closure']
-        if any(keyword in text.lower() for keyword in section_keywords):
-            return True
-        return False
+        return _SECTION_KEYWORD_RE.search(text) is not None
 
     def _is_list_item_optimized(self, text, bbox, font_size):
         """优化的列表项判断"""
-        import re
-        
-        # 匹配数字编号：1. 2. 3. 等
-        if re.match(r'^\d+\.', text.strip()):
-            return True
-        # 匹配字母编号：a. b. c. 等
-        if re.match(r'^[a-z]\.', text.strip()):
-            return True
-        # 匹配罗马数字：i. ii. iii. 等
-        if re.match(r'^[ivxlcdm]+\.', text.strip(), re.IGNORECASE):
-            return True
-        # 匹配项目符号
-        if text.strip().startswith('•') or text.strip().startswith('-'):
+        stripped = text.strip()
+
+        # 匹配编号（数字/字母/罗马数字）和项目符号
+        if _LIST_PREFIX_RE.match(stripped) or stripped.startswith(('•', '-')):
             return True
         # 检查是否包含列表项关键词
-        list_keywords = ['opening', 'conceptual', 'proposal', 'information', 'summaries', 'informal', 'secretariat', 'report', 'closure']
-        if any(keyword in text.lower() for keyword in list_keywords):
-            return True
-        return False
+        return _LIST_KEYWORD_RE.search(text) is not None
 
     def _is_header_info_optimized(self, text, bbox, page_width):
         """优化的页眉信息判断"""
@@ -1824,10 +2457,7 @@ class PDFConverter:
         if len(bbox) >= 4 and bbox[1] < 100:
             return True
         # 检查是否包含文档编号或日期
-        header_keywords = ['a/inb', 'geneva', 'november', 'december', '2022']
-        if any(keyword in text.lower() for keyword in header_keywords):
-            return True
-        return False
+        return _HEADER_OPT_RE.search(text) is not None
 
     def _is_footer_info(self, text, bbox, page_width):
         """判断是否为页脚信息"""
@@ -1835,7 +2465,7 @@ class PDFConverter:
         if len(bbox) >= 4 and bbox[3] > 700:  # 假设页面高度约800
             return True
         # 检查是否包含脚注特征
-        if text.strip().startswith('1 ') and len(text) > 100:
+        if len(text) > 100 and text.strip().startswith('1 '):
             return True
         return False
 
@@ -1856,74 +2486,58 @@ class PDFConverter:
             self._set_paragraph_alignment(paragraph, bbox, page_width)
             
             # 基于参考文档的格式设置
-            self._set_formatting_based_on_reference(paragraph, line_info, structure, page_width)
-            
-            # 处理文本和样式
+            self._set_formatting_based_on_reference(paragraph, line_info, page_width)
+
+            # 处理文本和样式：run 子树经 _fast_add_run 一次性挂载
             for span in spans:
                 span_text = span["text"]
-                if span_text.strip():
-                    run = paragraph.add_run(span_text)
-                    
-                    # 应用字体样式
-                    word_font_name = self._get_font_mapping(span.get("font", font_name))
-                    run.font.name = word_font_name
-                    
-                    # 字体大小
+                if span_text and not span_text.isspace():
+                    word_font_name = _map_pdf_font(span.get("font", font_name))
                     span_size = span.get("size", font_size / 0.75)
                     word_font_size = max(8, min(72, span_size * 0.75))
-                    from docx.shared import Pt
-                    run.font.size = Pt(word_font_size)
-                    
-                    # 粗体
                     span_flags = span.get("flags", 0)
-                    run.bold = bool((span_flags & 2**4) or is_bold)
-                    
-                    # 斜体
-                    run.italic = span_flags & 2**1
-                    
-                    # 颜色
-                    if "color" in span:
-                        color = span["color"]
-                        if color != 0:
-                            rgb_color = self._convert_color_to_rgb(color)
-                            if rgb_color:
-                                try:
-                                    from docx.shared import RGBColor
-                                    run.font.color.rgb = RGBColor(*rgb_color)
-                                except Exception as color_error:
-                                    logger.warning(f"设置字体颜色失败: {color_error}")
-            
+
+                    color_hex = None
+                    color = span.get("color", 0)
+                    if color != 0:
+                        rgb_color = _convert_color_tuple(color)
+                        if rgb_color:
+                            color_hex = '%02X%02X%02X' % rgb_color
+
+                    _fast_add_run(
+                        paragraph, span_text, word_font_name, word_font_size,
+                        bool((span_flags & FLAG_BOLD) or is_bold),
+                        bool(span_flags & FLAG_ITALIC),
+                        color_hex,
+                    )
+
         except Exception as e:
-            logger.error(f"优化行处理失败: {e}")
+            logger.error("优化行处理失败: %s", e)
 
-    def _set_formatting_based_on_reference(self, paragraph, line_info, structure, page_width):
+    def _set_formatting_based_on_reference(self, paragraph, line_info, page_width):
         """基于参考文档的格式设置"""
         try:
-            from docx.shared import Inches, Pt
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
             
             text = line_info['text']
+            text_lower = line_info.get('text_lower') or text.lower()
             bbox = line_info['bbox']
             font_size = line_info['font_size']
-            
+
             # 计算行的X中心位置
             x_center = (bbox[0] + bbox[2]) / 2
             page_center = page_width / 2
             
-            # 特殊处理分隔线
-            if '=' in text and text.strip().replace('=', '').replace(' ', '') == '':
+            # 特殊处理分隔线：strip('= ') 为空即整行只有等号和空格
+            if '=' in text and not text.strip().strip('= '):
                 # 分隔线格式：居中对齐，无缩进
                 paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                paragraph.paragraph_format.left_indent = Inches(0)
-                paragraph.paragraph_format.first_line_indent = Inches(0)
-                paragraph.paragraph_format.space_after = Pt(6.0)
+                paragraph.paragraph_format.left_indent = _IN_0
+                paragraph.paragraph_format.first_line_indent = _IN_0
+                paragraph.paragraph_format.space_after = _PT_6
                 return
-            
+
             # 基于PDF实际位置设置对齐方式
-            if '=' in text and text.strip().replace('=', '').replace(' ', '') == '':
-                # 分隔线居中对齐
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            elif x_center > page_center + 100:
+            if x_center > page_center + 100:
                 # 明显在右侧，右对齐
                 paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
             elif abs(x_center - page_center) < 50:
@@ -1934,55 +2548,60 @@ class PDFConverter:
                 paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
             
             # 基于参考文档的精确格式设置
-            if self._is_document_title(text, bbox, font_size, line_info['is_bold']):
+            # 结构分析阶段已缓存分类结果，直接读取；未经过结构分析的行按旧逻辑现算一次
+            category = line_info.get('category')
+            if category is None:
+                category = self._classify_line(line_info, page_width)
+
+            if category == 'title':
                 # 文档标题格式：负缩进，小间距
-                paragraph.paragraph_format.left_indent = Inches(-0.003)
-                paragraph.paragraph_format.first_line_indent = Inches(-0.007)
-                paragraph.paragraph_format.space_after = Pt(0.1)
-                
-            elif self._is_section_title(text, bbox, font_size, line_info['is_bold']):
+                paragraph.paragraph_format.left_indent = _IN_NEG_0_003
+                paragraph.paragraph_format.first_line_indent = _IN_NEG_0_007
+                paragraph.paragraph_format.space_after = _PT_0_1
+
+            elif category == 'subtitle':
                 # 章节标题格式：无缩进，无间距
-                paragraph.paragraph_format.left_indent = Inches(0)
-                paragraph.paragraph_format.first_line_indent = Inches(0)
-                paragraph.paragraph_format.space_after = Pt(0)
-                
-            elif self._is_list_item_optimized(text, bbox, font_size):
+                paragraph.paragraph_format.left_indent = _IN_0
+                paragraph.paragraph_format.first_line_indent = _IN_0
+                paragraph.paragraph_format.space_after = _PT_0
+
+            elif category == 'list':
                 # 列表项格式：负首行缩进，较大间距
-                if 'agenda' in text.lower() or 'opening' in text.lower() or 'closure' in text.lower():
+                if 'agenda' in text_lower or 'opening' in text_lower or 'closure' in text_lower:
                     # 主要列表项
-                    paragraph.paragraph_format.left_indent = Inches(0)
-                    paragraph.paragraph_format.first_line_indent = Inches(-0.393)
-                    paragraph.paragraph_format.space_after = Pt(12.95)
+                    paragraph.paragraph_format.left_indent = _IN_0
+                    paragraph.paragraph_format.first_line_indent = _IN_NEG_0_393
+                    paragraph.paragraph_format.space_after = _PT_12_95
                 else:
                     # 子列表项
-                    paragraph.paragraph_format.left_indent = Inches(0)
-                    paragraph.paragraph_format.first_line_indent = Inches(-0.138)
-                    paragraph.paragraph_format.space_after = Pt(12.95)
+                    paragraph.paragraph_format.left_indent = _IN_0
+                    paragraph.paragraph_format.first_line_indent = _IN_NEG_0_138
+                    paragraph.paragraph_format.space_after = _PT_12_95
                     
-            elif self._is_header_info_optimized(text, bbox, page_width):
+            elif category == 'header':
                 # 页眉信息格式：负缩进，小间距
-                paragraph.paragraph_format.left_indent = Inches(-0.010)
-                paragraph.paragraph_format.first_line_indent = Inches(0)
-                paragraph.paragraph_format.space_after = Pt(0.1)
-                
-            elif self._is_footer_info(text, bbox, page_width):
+                paragraph.paragraph_format.left_indent = _IN_NEG_0_010
+                paragraph.paragraph_format.first_line_indent = _IN_0
+                paragraph.paragraph_format.space_after = _PT_0_1
+
+            elif category == 'footer':
                 # 页脚信息格式：正缩进，无间距
-                paragraph.paragraph_format.left_indent = Inches(0)
-                paragraph.paragraph_format.first_line_indent = Inches(0.394)
-                paragraph.paragraph_format.space_after = Pt(0)
+                paragraph.paragraph_format.left_indent = _IN_0
+                paragraph.paragraph_format.first_line_indent = _IN_0_394
+                paragraph.paragraph_format.space_after = _PT_0
                 
             else:
                 # 正文格式：根据内容调整
-                if 'information' in text.lower() or 'summaries' in text.lower():
+                if 'information' in text_lower or 'summaries' in text_lower:
                     # 信息文档类
-                    paragraph.paragraph_format.left_indent = Inches(0)
-                    paragraph.paragraph_format.first_line_indent = Inches(-0.138)
-                    paragraph.paragraph_format.space_after = Pt(12.95)
+                    paragraph.paragraph_format.left_indent = _IN_0
+                    paragraph.paragraph_format.first_line_indent = _IN_NEG_0_138
+                    paragraph.paragraph_format.space_after = _PT_12_95
                 else:
                     # 普通正文
-                    paragraph.paragraph_format.left_indent = Inches(0)
-                    paragraph.paragraph_format.first_line_indent = Inches(0)
-                    paragraph.paragraph_format.space_after = Pt(6.0)
+                    paragraph.paragraph_format.left_indent = _IN_0
+                    paragraph.paragraph_format.first_line_indent = _IN_0
+                    paragraph.paragraph_format.space_after = _PT_6
             
             # 设置行间距
             if font_size >= 16:
@@ -1991,18 +2610,21 @@ class PDFConverter:
                 paragraph.paragraph_format.line_spacing = 1.029
             
         except Exception as e:
-            logger.warning(f"基于参考文档的格式设置失败: {e}") 
+            logger.warning("基于参考文档的格式设置失败: %s", e)
 
     def _collect_and_sort_content(self, text_dict, page):
         """收集并排序所有内容（文本、图片和水平线）"""
         all_content = []
         
+        # 页面宽度只读一次，后续处理复用
+        page_width = page.rect.width
+
         # 收集文本内容
         text_lines = []
         for block in text_dict.get("blocks", []):
             if "lines" in block:  # 文本块
                 for line in block["lines"]:
-                    line_info = self._extract_line_info(line, block, page.rect.width)
+                    line_info = self._extract_line_info(line, block, page_width)
                     if line_info:
                         text_lines.append(line_info)
         
@@ -2026,32 +2648,39 @@ class PDFConverter:
                     'position': block["bbox"][1]  # 使用Y坐标作为位置
                 })
         
-        # 收集水平线内容
+        # 收集水平线内容：矩形批量装入 numpy 数组，宽高判断向量化
         try:
-            paths = page.get_drawings()
-            for path in paths:
-                if 'rect' in path:
-                    rect = path['rect']
-                    width = rect[2] - rect[0]
-                    height = rect[3] - rect[1]
-                    
-                    # 判断是否是水平线
-                    if width > height * 5 and height < 10:
-                        all_content.append({
-                            'type': 'horizontal_line',
-                            'data': {
-                                'rect': rect,
-                                'width': width,
-                                'height': height,
-                                'y_position': rect[1]
-                            },
-                            'position': rect[1]  # 使用Y坐标作为位置
-                        })
+            rect_paths = [p for p in page.get_drawings() if 'rect' in p]
+            if rect_paths:
+                rects = np.array(
+                    [tuple(p['rect']) for p in rect_paths], dtype=np.float32
+                )
+                widths = rects[:, 2] - rects[:, 0]
+                heights = rects[:, 3] - rects[:, 1]
+                line_mask = (widths > heights * 5) & (heights < 10)
+                for idx in np.nonzero(line_mask)[0].tolist():
+                    rect = rect_paths[idx]['rect']
+                    width = float(widths[idx])
+                    height = float(heights[idx])
+                    all_content.append({
+                        'type': 'horizontal_line',
+                        'data': {
+                            'rect': rect,
+                            'width': width,
+                            'height': height,
+                            'y_position': rect[1]
+                        },
+                        'position': rect[1]  # 使用Y坐标作为位置
+                    })
         except Exception as e:
-            logger.warning(f"提取水平线失败: {e}")
+            logger.warning("提取水平线失败: %s", e)
         
-        # 按位置排序（从上到下）
-        all_content.sort(key=lambda x: x['position'])
+        # 按位置排序（从上到下）：位置键装入 numpy 数组后稳定 argsort
+        if len(all_content) > 1:
+            n_items = len(all_content)
+            positions = np.fromiter((c['position'] for c in all_content), dtype=np.float32, count=n_items)
+            order = np.argsort(positions, kind='stable')
+            all_content = [all_content[i] for i in order.tolist()]
         
         return all_content
 
@@ -2063,49 +2692,34 @@ class PDFConverter:
             # 创建段落
             paragraph = doc.add_paragraph()
             
-            # 分析文档结构（这里简化处理）
-            structure = {'title_lines': [], 'subtitle_lines': [], 'body_lines': [], 'list_items': [], 'header_info': [], 'footer_info': []}
-            
             # 基于参考文档的格式设置（包含对齐方式）
-            self._set_formatting_based_on_reference(paragraph, line_info, structure, page_width)
+            self._set_formatting_based_on_reference(paragraph, line_info, page_width)
             
-            # 处理文本和样式
+            # 处理文本和样式：run 子树经 _fast_add_run 一次性挂载
             for span in line_info['spans']:
                 span_text = span["text"]
-                if span_text.strip():
-                    run = paragraph.add_run(span_text)
-                    
-                    # 应用字体样式
-                    word_font_name = self._get_font_mapping(span.get("font", line_info['font_name']))
-                    run.font.name = word_font_name
-                    
-                    # 字体大小
+                if span_text and not span_text.isspace():
+                    word_font_name = _map_pdf_font(span.get("font", line_info['font_name']))
                     span_size = span.get("size", line_info['font_size'] / 0.75)
                     word_font_size = max(8, min(72, span_size * 0.75))
-                    from docx.shared import Pt
-                    run.font.size = Pt(word_font_size)
-                    
-                    # 粗体
                     span_flags = span.get("flags", 0)
-                    run.bold = bool((span_flags & 2**4) or line_info['is_bold'])
-                    
-                    # 斜体
-                    run.italic = span_flags & 2**1
-                    
-                    # 颜色
-                    if "color" in span:
-                        color = span["color"]
-                        if color != 0:
-                            rgb_color = self._convert_color_to_rgb(color)
-                            if rgb_color:
-                                try:
-                                    from docx.shared import RGBColor
-                                    run.font.color.rgb = RGBColor(*rgb_color)
-                                except Exception as color_error:
-                                    logger.warning(f"设置字体颜色失败: {color_error}")
-            
+
+                    color_hex = None
+                    color = span.get("color", 0)
+                    if color != 0:
+                        rgb_color = _convert_color_tuple(color)
+                        if rgb_color:
+                            color_hex = '%02X%02X%02X' % rgb_color
+
+                    _fast_add_run(
+                        paragraph, span_text, word_font_name, word_font_size,
+                        bool((span_flags & FLAG_BOLD) or line_info['is_bold']),
+                        bool(span_flags & FLAG_ITALIC),
+                        color_hex,
+                    )
+
         except Exception as e:
-            logger.error(f"处理文本内容失败: {e}")
+            logger.error("处理文本内容失败: %s", e)
 
     def _process_image_content(self, doc, content, pdf_document, page_num, page):
         """处理图片内容"""
@@ -2116,63 +2730,30 @@ class PDFConverter:
             img_rect = block["bbox"]
             img_data = block["image"]
             
-            # 直接保存PNG数据到临时文件
-            temp_img_path = self._save_image_data(img_data, page_num, img_rect)
-            
-            if temp_img_path:
-                # 计算合适的图片大小
-                page_width = page.rect.width
-                page_height = page.rect.height
-                img_width, img_height = self._calculate_image_size(
-                    block, page_width, page_height
-                )
-                
-                # 在指定位置插入图片
-                self._insert_image_at_position(doc, temp_img_path, img_width, img_height, img_rect, page_width)
-                
-                # 清理临时文件
-                import os
-                os.remove(temp_img_path)
-                
-                logger.info(f"成功插入图片，位置: {img_rect}, 大小: {img_width:.2f}in x {img_height:.2f}in")
-            
-        except Exception as img_error:
-            logger.warning(f"处理图片失败: {img_error}")
+            # 字节数据直接经内存流喂给 add_picture，省掉临时文件的写盘/删盘
+            if not isinstance(img_data, bytes):
+                logger.warning("不支持的图片数据类型: %s", type(img_data))
+                return
 
-    def _save_image_data(self, img_data, page_num, img_rect):
-        """保存图片数据到临时文件"""
-        try:
-            import os
-            
-            # 生成临时文件路径
-            temp_img_file = tempfile.NamedTemporaryFile(suffix=f"_pdf_img_data_{page_num}_{hash(str(img_rect))}.png", delete=False)
-            temp_img_path = temp_img_file.name
-            temp_img_file.close()
-            
-            # 如果img_data是字节串，直接写入文件
-            if isinstance(img_data, bytes):
-                with open(temp_img_path, 'wb') as f:
-                    f.write(img_data)
-                
-                # 验证文件是否成功创建
-                if os.path.exists(temp_img_path) and os.path.getsize(temp_img_path) > 0:
-                    return temp_img_path
-                else:
-                    logger.warning(f"图片文件创建失败 (页面 {page_num})")
-                    return None
-            else:
-                logger.warning(f"不支持的图片数据类型: {type(img_data)}")
-                return None
-                
-        except Exception as e:
-            logger.warning(f"保存图片数据失败 (页面 {page_num}): {e}")
-            return None
+            # 计算合适的图片大小（page.rect 每次访问都会新建 Rect，只取一次）
+            page_rect = page.rect
+            page_width = page_rect.width
+            page_height = page_rect.height
+            img_width, img_height = self._calculate_image_size(
+                block, page_width, page_height
+            )
+
+            # 在指定位置插入图片
+            self._insert_image_at_position(doc, io.BytesIO(img_data), img_width, img_height, img_rect, page_width)
+
+            logger.info("成功插入图片，位置: %s, 大小: %.2fin x %.2fin", img_rect, img_width, img_height)
 
-    def _insert_image_at_position(self, doc, image_path, img_width, img_height, img_rect, page_width):
+        except Exception as img_error:
+            logger.warning("处理图片失败: %s", img_error)
+
+    def _insert_image_at_position(self, doc, image_source, img_width, img_height, img_rect, page_width):
         """在指定位置插入图片"""
         try:
-            from docx.shared import Inches
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
             
             # 创建图片段落
             img_paragraph = doc.add_paragraph()
@@ -2188,13 +2769,13 @@ class PDFConverter:
             else:  # 右对齐
                 img_paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
             
-            # 添加图片到段落
-            img_paragraph.add_run().add_picture(image_path, width=Inches(img_width))
+            # 添加图片到段落（路径或内存流均可）
+            img_paragraph.add_run().add_picture(image_source, width=Inches(img_width))
             
-            logger.info(f"在位置 {img_rect} 插入图片，大小: {img_width:.2f}in x {img_height:.2f}in")
+            logger.info("在位置 %s 插入图片，大小: %.2fin x %.2fin", img_rect, img_width, img_height)
             
         except Exception as e:
-            logger.error(f"插入图片失败: {e}")
+            logger.error("插入图片失败: %s", e)
 
     def _merge_related_text_lines(self, text_lines):
         """合并相关的文本行"""
@@ -2209,7 +2790,7 @@ class PDFConverter:
         
         while i < len(text_lines):
             current_line = text_lines[i]
-            merged_text = current_line['text']
+            parts = [current_line['text']]  # 文本片段缓冲，最后一次 join
             merged_bbox = current_line['bbox'].copy()
             
             # 检查下一行是否应该合并
@@ -2222,7 +2803,7 @@ class PDFConverter:
                 
                 if y_diff < 5:  # 如果Y位置差异小于5，认为是同一行
                     # 合并文本
-                    merged_text += ' ' + next_line['text']
+                    parts.append(next_line['text'])
                     
                     # 更新边界框
                     merged_bbox[0] = min(merged_bbox[0], next_line['bbox'][0])
@@ -2236,7 +2817,10 @@ class PDFConverter:
             
             # 创建合并后的行信息
             merged_line = current_line.copy()
+            merged_text = ' '.join(parts)
             merged_line['text'] = merged_text
+            if 'text_lower' in merged_line:
+                merged_line['text_lower'] = merged_text.lower()
             merged_line['bbox'] = tuple(merged_bbox)
             
             merged_lines.append(merged_line)
@@ -2247,8 +2831,6 @@ class PDFConverter:
     def _insert_horizontal_line(self, doc, line_data, page_width):
         """插入水平线"""
         try:
-            from docx.shared import Inches
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
             
             # 创建水平线段落
             line_paragraph = doc.add_paragraph()
@@ -2274,10 +2856,10 @@ class PDFConverter:
             # 设置段落间距
             line_paragraph.paragraph_format.space_after = 6
             
-            logger.info(f"插入水平线，位置: Y={line_data['y_position']:.1f}, 宽度: {line_width_inches:.2f}in")
+            logger.info("插入水平线，位置: Y=%.1f, 宽度: %.2fin", line_data['y_position'], line_width_inches)
             
         except Exception as e:
-            logger.error(f"插入水平线失败: {e}") 
+            logger.error("插入水平线失败: %s", e)
 
     async def _pdf_to_docx_with_pdf2docx(
         self, 
@@ -2315,104 +2897,156 @@ class PDFConverter:
             }
             
         except Exception as e:
-            logger.error(f"pdf2docx 转换失败: {e}")
+            logger.error("pdf2docx 转换失败: %s", e)
             raise e 
 
+    def _parse_docx_page(
+        self,
+        input_path: str,
+        page_num: int,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[bytes] = None
+    ) -> Tuple[int, List[Dict[str, Any]], float]:
+        """在工作线程中收集单页内容（供 _pdf_to_docx_custom 并行调用）
+
+        每个线程打开自己的文档句柄做文本解析和图片位置估算，
+        PyMuPDF 的 C 代码会释放 GIL，解析阶段可以跨核并行
+
+        Returns:
+            (页码, 页面内容列表, 页面宽度)
+        """
+        pdf_document = self._open_pdf(input_path, pdf_bytes)
+        try:
+            page = pdf_document[page_num - 1]
+
+            # 一次性取出后续需要的全部 fitz 数据，之后只操作纯 Python 结构，
+            # 不再反复跨越 Python/C 边界；Page 引用尽早丢弃
+            page_width = page.rect.width
+            text_dict = self._get_page_text_dict(page, page_num, pdf_digest)
+            image_list = self._get_page_images(page, pdf_digest)
+            page = None
+
+            # 收集页面上的所有内容（文本和图片，各自成流，最后归并）
+            text_entries = []
+            image_entries = []
+
+            # 1. 收集文本内容
+            for block in text_dict.get("blocks", []):
+                if "lines" in block:  # 文本块
+                    for line in block["lines"]:
+                        # 计算文本块的垂直位置
+                        if line["spans"]:
+                            first_span = line["spans"][0]
+                            bbox = first_span.get("bbox", [0, 0, 0, 0])
+                            y_position = bbox[1]  # 垂直位置
+
+                            text_entries.append({
+                                'type': 'text',
+                                'y_position': y_position,
+                                'data': line
+                            })
+
+            # 2. 收集图片内容
+            # y 坐标存成紧凑的 float64 数组，排序和极差计算都在 C 级完成
+            text_positions = np.fromiter(
+                (entry['y_position'] for entry in text_entries),
+                dtype=np.float64, count=len(text_entries)
+            )
+
+            if image_list:
+                # 根据文本分布智能插入图片：排序和插入点算式挪出循环，
+                # numpy 广播一次算出所有图片的 y 坐标
+                n_imgs = len(image_list)
+                if text_positions.size:
+                    text_positions.sort()
+                    if text_positions.size > 1:
+                        avg_gap = (text_positions[-1] - text_positions[0]) / (text_positions.size - 1)
+                        insert_positions = (
+                            text_positions[0]
+                            + np.arange(1, n_imgs + 1) * avg_gap / (n_imgs + 1)
+                        )
+                    else:
+                        insert_positions = text_positions[0] + 200 + np.arange(n_imgs) * 100
+                else:
+                    insert_positions = 400 + np.arange(n_imgs) * 200
+
+                for img_index, img in enumerate(image_list):
+                    try:
+                        y_position = float(insert_positions[img_index])
+
+                        image_entries.append({
+                            'type': 'image',
+                            'y_position': y_position,
+                            'data': {
+                                'img': img,
+                                'img_index': img_index,
+                                'page_num': page_num,
+                                'img_rect': None
+                            }
+                        })
+                    except Exception as img_error:
+                        logger.warning("处理图片失败: %s", img_error)
+                        continue
+
+            # 3. 归并两条流：文本排一次序，图片 y 坐标本身递增，
+            # heapq.merge 用 C 级 key 取值器做 O(N) 合并
+            text_entries.sort(key=itemgetter('y_position'))
+            page_content = list(_heap_merge(
+                text_entries, image_entries, key=itemgetter('y_position')
+            ))
+
+            return page_num, page_content, page_width
+        finally:
+            pdf_document.close()
+
     async def _pdf_to_docx_custom(
-        self, 
-        input_path: str, 
-        output_path: str, 
-        options: Optional[Dict[str, Any]] = None
+        self,
+        input_path: str,
+        output_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_digest: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         使用自定义实现进行 PDF 转 Word 转换
         """
         try:
-            from docx import Document
-            from docx.shared import Inches, Pt
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            import fitz  # PyMuPDF
-            
+
             # 创建 Word 文档
             doc = Document()
-            
-            # 使用 PyMuPDF 提取文本和图片
-            pdf_document = fitz.open(input_path)
+
+            # 末尾哨兵段落：add_paragraph 每次都要在 body 里定位插入点，
+            # 整篇累计为 O(N²)；在哨兵前 insert_paragraph_before 是 O(1)
+            tail = doc.add_paragraph()
+
+            # 使用 PyMuPDF 提取文本和图片（优先从内存字节打开）
+            pdf_document = self._open_pdf(input_path, pdf_bytes)
             
             # 处理页面范围
             pages = self._get_pages_to_process(pdf_document, options)
-            
-            for page_num in pages:
-                page = pdf_document[page_num - 1]
-                
-                # 收集页面上的所有内容（文本和图片）
-                page_content = []
-                
-                # 1. 收集文本内容
-                text_dict = page.get_text("dict")
-                for block in text_dict.get("blocks", []):
-                    if "lines" in block:  # 文本块
-                        for line in block["lines"]:
-                            # 计算文本块的垂直位置
-                            if line["spans"]:
-                                first_span = line["spans"][0]
-                                bbox = first_span.get("bbox", [0, 0, 0, 0])
-                                y_position = bbox[1]  # 垂直位置
-                                
-                                page_content.append({
-                                    'type': 'text',
-                                    'y_position': y_position,
-                                    'data': line
-                                })
-                
-                # 2. 收集图片内容
-                text_positions = []
-                for content in page_content:
-                    if content['type'] == 'text':
-                        text_positions.append(content['y_position'])
-                
-                # 获取图片列表
-                image_list = page.get_images()
-                if image_list:
-                    for img_index, img in enumerate(image_list):
-                        try:
-                            # 智能插入图片位置
-                            y_position = None
-                            
-                            # 根据文本分布智能插入图片
-                            if text_positions:
-                                text_positions.sort()
-                                if len(text_positions) > 1:
-                                    avg_gap = (text_positions[-1] - text_positions[0]) / (len(text_positions) - 1)
-                                    insert_position = text_positions[0] + (img_index + 1) * avg_gap / (len(image_list) + 1)
-                                    y_position = insert_position
-                                else:
-                                    y_position = text_positions[0] + 200 + img_index * 100
-                            else:
-                                y_position = 400 + img_index * 200
-                            
-                            page_content.append({
-                                'type': 'image',
-                                'y_position': y_position,
-                                'data': {
-                                    'img': img,
-                                    'img_index': img_index,
-                                    'page_num': page_num,
-                                    'img_rect': None
-                                }
-                            })
-                        except Exception as img_error:
-                            logger.warning(f"处理图片失败: {img_error}")
-                            continue
-                
-                # 3. 按垂直位置排序内容
-                page_content.sort(key=lambda x: x['y_position'])
-                
+
+            # 并行收集各页内容（文本解析和图片位置估算在工作线程中完成），
+            # python-docx 不支持跨线程写入，段落构建仍由主线程按页序进行
+            loop = asyncio.get_running_loop()
+            pool = self._get_executor()
+            parsed_pages = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, self._parse_docx_page, input_path, page_num, pdf_bytes, pdf_digest
+                )
+                for page_num in pages
+            ])
+
+            # 热循环内反复调用的方法提升为局部变量，省去每次属性查找
+            set_paragraph_alignment = self._set_paragraph_alignment
+            set_line_spacing = self._set_line_spacing
+            set_paragraph_spacing = self._set_paragraph_spacing
+
+            for page_num, page_content, page_width in parsed_pages:
                 # 4. 按顺序处理内容 - 改进的文本合并逻辑
                 current_paragraph = None
                 current_line_bbox = None
                 current_max_font_size = 0
-                
+
                 for content in page_content:
                     if content['type'] == 'text':
                         # 处理文本
@@ -2423,9 +3057,7 @@ class PDFConverter:
                         if line["spans"]:
                             first_span = line["spans"][0]
                             line_bbox = first_span.get("bbox", [0, 0, 0, 0])
-                        
-                        page_width = page.rect.width
-                        
+
                         # 检查是否需要创建新段落
                         should_create_new_paragraph = True
                         
@@ -2444,72 +3076,75 @@ class PDFConverter:
                             if current_paragraph is not None:
                                 # 设置当前段落的格式
                                 if current_max_font_size > 0:
-                                    self._set_line_spacing(current_paragraph, current_max_font_size)
-                                    self._set_paragraph_spacing(current_paragraph, current_max_font_size)
-                            
-                            # 创建新段落
-                            current_paragraph = doc.add_paragraph()
+                                    set_line_spacing(current_paragraph, current_max_font_size)
+                                    set_paragraph_spacing(current_paragraph, current_max_font_size)
+
+                            # 创建新段落（哨兵前插入，常数时间）
+                            current_paragraph = tail.insert_paragraph_before()
                             current_line_bbox = line_bbox
                             current_max_font_size = 0
-                            
+
                             # 设置段落对齐方式
-                            self._set_paragraph_alignment(current_paragraph, line_bbox, page_width)
+                            set_paragraph_alignment(current_paragraph, line_bbox, page_width)
                         
-                        # 处理每个文本片段
-                        for span in line["spans"]:
-                            span_text = span["text"]
-                            if span_text.strip():
-                                run = current_paragraph.add_run(span_text)
-                                
+                        # 处理文本片段：相邻同样式的片段合并为一个 run，
+                        # 减少 python-docx 的 lxml 元素创建次数
+                        # PyMuPDF 的 dict 输出始终带有这些键，直接下标取值
+                        try:
+                            add_run = current_paragraph.add_run
+                            for style_key, span_group in groupby(
+                                line["spans"], key=_SPAN_STYLE_KEY
+                            ):
+                                span_text = ''.join(s["text"] for s in span_group)
+                                if not span_text or span_text.isspace():
+                                    continue
+                                run = add_run(span_text)
+
+                                span_font, span_size, span_flags, span_color = style_key
+
                                 # 应用字体样式
-                                font_name = span.get("font", "Arial")
-                                run.font.name = self._get_font_mapping(font_name)
-                                
+                                run.font.name = _map_pdf_font(span_font)
+
                                 # 字体大小
-                                span_size = span.get("size", 12)
                                 word_font_size = max(8, min(72, span_size * 0.75))
                                 run.font.size = Pt(word_font_size)
-                                current_max_font_size = max(current_max_font_size, word_font_size)
-                                
-                                # 粗体
-                                span_flags = span.get("flags", 0)
-                                run.bold = bool(span_flags & 2**4)
-                                
-                                # 斜体
-                                run.italic = bool(span_flags & 2**1)
-                                
+                                if word_font_size > current_max_font_size:
+                                    current_max_font_size = word_font_size
+
+                                # 粗体 / 斜体
+                                run.bold = bool(span_flags & FLAG_BOLD)
+                                run.italic = bool(span_flags & FLAG_ITALIC)
+
                                 # 颜色
-                                span_color = span.get("color", 0)
                                 if span_color != 0:
-                                    rgb_color = self._convert_color_to_rgb(span_color)
+                                    rgb_color = _convert_color_tuple(span_color)
                                     if rgb_color:
                                         try:
-                                            from docx.shared import RGBColor
-                                            run.font.color.rgb = RGBColor(*rgb_color)
+                                            run.font.color.rgb = _make_rgb_color(span_color)
                                         except Exception as color_error:
-                                            logger.warning(f"设置字体颜色失败: {color_error}")
+                                            logger.warning("设置字体颜色失败: %s", color_error)
+                        except KeyError as span_error:
+                            logger.warning("文本片段缺少字段: %s", span_error)
                     
                     elif content['type'] == 'image':
                         # 处理图片
                         img_data = content['data']
                         try:
-                            # 安全提取图片
-                            temp_img_path = self._extract_image_safely(
-                                pdf_document, 
-                                img_data['img'], 
-                                img_data['page_num'], 
+                            # 提取为内存字节，全程不落盘
+                            extracted = self._extract_image_bytes(
+                                pdf_document,
+                                img_data['img'],
+                                img_data['page_num'],
                                 img_data['img_index']
                             )
-                            
-                            if temp_img_path:
+
+                            if extracted:
+                                img_stream = io.BytesIO(extracted[0])
+
                                 # 智能计算图片尺寸
-                                from docx.shared import Inches
-                                from PIL import Image as PILImage
-                                
                                 try:
-                                    # 获取原始图片尺寸
-                                    with PILImage.open(temp_img_path) as pil_img:
-                                        img_width, img_height = pil_img.size
+                                    # 获取原始图片尺寸（仅解析头部字节）
+                                    img_width, img_height = _fast_image_size(extracted[0])
                                     
                                     # 计算合适的Word图片尺寸
                                     max_width_inches = 3.5
@@ -2538,29 +3173,33 @@ class PDFConverter:
                                     if height_inches < min_height_inches:
                                         height_inches = min_height_inches
                                     
-                                    # 添加图片到文档
-                                    doc.add_picture(temp_img_path, width=Inches(width_inches))
-                                    
+                                    # 添加图片到文档（同样经哨兵保持与文本的相对顺序）
+                                    tail.insert_paragraph_before().add_run().add_picture(
+                                        img_stream, width=Inches(width_inches)
+                                    )
+
                                 except Exception as size_error:
-                                    logger.warning(f"图片尺寸计算失败，使用默认尺寸: {size_error}")
-                                    doc.add_picture(temp_img_path, width=Inches(2.5))
-                                
-                                # 清理临时文件
-                                import os
-                                os.remove(temp_img_path)
-                                
+                                    logger.warning("图片尺寸计算失败，使用默认尺寸: %s", size_error)
+                                    img_stream.seek(0)
+                                    tail.insert_paragraph_before().add_run().add_picture(
+                                        img_stream, width=Inches(2.5)
+                                    )
+
                         except Exception as img_error:
-                            logger.warning(f"处理图片失败: {img_error}")
+                            logger.warning("处理图片失败: %s", img_error)
                             continue
                 
                 # 完成最后一个段落
                 if current_paragraph is not None and current_max_font_size > 0:
-                    self._set_line_spacing(current_paragraph, current_max_font_size)
-                    self._set_paragraph_spacing(current_paragraph, current_max_font_size)
+                    set_line_spacing(current_paragraph, current_max_font_size)
+                    set_paragraph_spacing(current_paragraph, current_max_font_size)
             
             # 关闭 PDF 文档
             pdf_document.close()
-            
+
+            # 移除哨兵段落后保存
+            tail._element.getparent().remove(tail._element)
+
             # 保存 Word 文档
             doc.save(output_path)
             
@@ -2571,7 +3210,7 @@ class PDFConverter:
             }
             
         except Exception as e:
-            logger.error(f"自定义实现转换失败: {e}")
+            logger.error("自定义实现转换失败: %s", e)
             return {
                 'success': False,
                 'error': f'PDF 转 Word 失败: {str(e)}'
@@ -1,6 +1,7 @@
 """
 文档转换服务主应用
 """
+import sys
 import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
@@ -18,17 +19,20 @@ from app.api.routes import router as api_router
 
 
 # 配置日志
+# enqueue=True 把格式化和写入移到后台线程，请求处理路径不再被日志阻塞
 logger.remove()
 logger.add(
     LOG_FILE,
     level=LOG_LEVEL,
     rotation="10 MB",
     retention="7 days",
+    enqueue=True,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
 )
 logger.add(
-    lambda msg: print(msg, end=""),
+    sys.stderr,
     level=LOG_LEVEL,
+    enqueue=True,
     format="{time:HH:mm:ss} | {level} | {message}"
 )
 
@@ -3,6 +3,7 @@
 集成多种转换器，提供统一的转换接口
 """
 import asyncio
+import itertools
 import time
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -20,7 +21,11 @@ from app.converters.cross_type_converter import CrossTypeConverter
 
 class ConversionService:
     """文档转换服务"""
-    
+
+    # 输出文件名序号：进程内单调递增，并发批量转换也不会同名
+    _seq = itertools.count()
+
+
     def __init__(self):
         """初始化转换服务"""
         # 初始化转换器
@@ -40,6 +45,23 @@ class ConversionService:
             'markdown': self.markdown_converter,
             'cross_type': self.cross_type_converter
         }
+
+        # 预展开 (输入格式, 目标格式) 组合，支持性检查只做一次哈希查找
+        self._supported_pairs = frozenset(
+            (ext, target)
+            for ext, targets in SUPPORTED_CONVERSIONS.items()
+            for target in targets
+        )
+
+        # 转换分发表：按转换器类型一次哈希查找，取代 isinstance/hasattr 链
+        self._dispatch = {
+            LibreOfficeConverter: self._convert_with_libreoffice,
+            PDFConverter: self._convert_with_pdf,
+            ImageConverter: self._convert_with_image,
+            DocumentToImageConverter: self._convert_with_document_to_image,
+            CrossTypeConverter: self._convert_with_cross_type,
+            MarkdownConverter: self._convert_with_markdown
+        }
     
     async def convert(
         self,
@@ -112,8 +134,7 @@ class ConversionService:
     
     def _is_conversion_supported(self, input_ext: str, target_format: str) -> bool:
         """检查转换是否支持"""
-        return (input_ext in SUPPORTED_CONVERSIONS and 
-                target_format in SUPPORTED_CONVERSIONS[input_ext])
+        return (input_ext, target_format) in self._supported_pairs
     
     def _select_converter(self, input_ext: str, target_format: str):
         """选择转换器"""
@@ -168,93 +189,118 @@ class ConversionService:
     ) -> Dict[str, Any]:
         """执行转换"""
         try:
-            # 根据转换器类型调用相应方法
-            if isinstance(converter, LibreOfficeConverter):
-                return await converter.convert_document(
-                    input_path, output_path, target_format, options
-                )
-            elif isinstance(converter, PDFConverter):
-                # 根据目标格式选择合适的方法
-                if target_format in ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'tif']:
-                    return await converter.pdf_to_image(
-                        input_path, output_path, target_format, options
-                    )
-                else:
-                    return await converter.pdf_to_office(
-                        input_path, output_path, target_format, options
-                    )
-            elif isinstance(converter, ImageConverter):
-                # 根据目标格式选择合适的方法
-                if target_format in ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'tif', 'webp']:
-                    return await converter.image_to_image(
-                        input_path, output_path, target_format, options
-                    )
-                elif target_format == 'pdf':
-                    return await converter.image_to_pdf(
-                        input_path, output_path, options
-                    )
-                elif target_format in ['docx', 'pptx', 'xlsx']:
-                    return await converter.image_to_office(
-                        input_path, output_path, target_format, options
-                    )
-                else:
-                    return {
-                        'success': False,
-                        'error': f'图片转换器不支持的目标格式: {target_format}'
-                    }
-            elif hasattr(converter, 'convert_to_image'):  # DocumentToImageConverter
-                return await converter.convert_to_image(
-                    input_path, output_path, target_format, options
-                )
-            elif hasattr(converter, 'convert_cross_type'):  # CrossTypeConverter
-                return await converter.convert_cross_type(
-                    input_path, output_path, target_format, options
-                )
-            elif hasattr(converter, 'markdown_to_pdf'):  # MarkdownConverter
-                # Markdown 转换器
-                if target_format == 'pdf':
-                    return await converter.markdown_to_pdf(
-                        input_path, output_path, options
-                    )
-                elif target_format == 'docx':
-                    return await converter.markdown_to_docx(
-                        input_path, output_path, options
-                    )
-                elif target_format == 'xlsx':
-                    return await converter.markdown_to_xlsx(
-                        input_path, output_path, options
-                    )
-                elif target_format == 'pptx':
-                    return await converter.markdown_to_pptx(
-                        input_path, output_path, options
-                    )
-                elif target_format in ['md', 'markdown']:
-                    return await converter.pdf_to_markdown(
-                        input_path, output_path, options
-                    )
-                else:
-                    return {
-                        'success': False,
-                        'error': f'Markdown 转换器不支持的目标格式: {target_format}'
-                    }
-            else:
+            # 按转换器类型从分发表取处理方法
+            handler = self._dispatch.get(type(converter))
+            if handler is None:
                 return {
                     'success': False,
                     'error': f'未知的转换器类型: {type(converter)}'
                 }
-                
+            return await handler(
+                converter, input_path, output_path, target_format, options
+            )
+
         except Exception as e:
             logger.error(f"转换执行失败: {e}")
             return {
                 'success': False,
                 'error': f'转换执行失败: {str(e)}'
             }
+
+    async def _convert_with_libreoffice(
+        self, converter, input_path, output_path, target_format, options
+    ) -> Dict[str, Any]:
+        """LibreOffice 转换"""
+        return await converter.convert_document(
+            input_path, output_path, target_format, options
+        )
+
+    async def _convert_with_pdf(
+        self, converter, input_path, output_path, target_format, options
+    ) -> Dict[str, Any]:
+        """PDF 转换：根据目标格式选择合适的方法"""
+        if target_format in ('jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'tif'):
+            return await converter.pdf_to_image(
+                input_path, output_path, target_format, options
+            )
+        return await converter.pdf_to_office(
+            input_path, output_path, target_format, options
+        )
+
+    async def _convert_with_image(
+        self, converter, input_path, output_path, target_format, options
+    ) -> Dict[str, Any]:
+        """图片转换：根据目标格式选择合适的方法"""
+        if target_format in ('jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'tif', 'webp'):
+            return await converter.image_to_image(
+                input_path, output_path, target_format, options
+            )
+        elif target_format == 'pdf':
+            return await converter.image_to_pdf(
+                input_path, output_path, options
+            )
+        elif target_format in ('docx', 'pptx', 'xlsx'):
+            return await converter.image_to_office(
+                input_path, output_path, target_format, options
+            )
+        return {
+            'success': False,
+            'error': f'图片转换器不支持的目标格式: {target_format}'
+        }
+
+    async def _convert_with_document_to_image(
+        self, converter, input_path, output_path, target_format, options
+    ) -> Dict[str, Any]:
+        """文档转图片"""
+        return await converter.convert_to_image(
+            input_path, output_path, target_format, options
+        )
+
+    async def _convert_with_cross_type(
+        self, converter, input_path, output_path, target_format, options
+    ) -> Dict[str, Any]:
+        """跨类型转换"""
+        return await converter.convert_cross_type(
+            input_path, output_path, target_format, options
+        )
+
+    async def _convert_with_markdown(
+        self, converter, input_path, output_path, target_format, options
+    ) -> Dict[str, Any]:
+        """Markdown 转换"""
+        if target_format == 'pdf':
+            return await converter.markdown_to_pdf(
+                input_path, output_path, options
+            )
+        elif target_format == 'docx':
+            return await converter.markdown_to_docx(
+                input_path, output_path, options
+            )
+        elif target_format == 'xlsx':
+            return await converter.markdown_to_xlsx(
+                input_path, output_path, options
+            )
+        elif target_format == 'pptx':
+            return await converter.markdown_to_pptx(
+                input_path, output_path, options
+            )
+        elif target_format in ('md', 'markdown'):
+            return await converter.pdf_to_markdown(
+                input_path, output_path, options
+            )
+        return {
+            'success': False,
+            'error': f'Markdown 转换器不支持的目标格式: {target_format}'
+        }
     
     def _generate_output_filename(self, input_path: str, target_format: str) -> str:
         """生成输出文件名"""
+        # 单调时钟 + 进程内计数器：无系统调用开销，且同一秒内也不冲突
         input_file = Path(input_path)
-        timestamp = int(time.time())
-        return f"{input_file.stem}_{timestamp}.{target_format}"
+        return (
+            f"{input_file.stem}_{next(self._seq):x}"
+            f"_{time.monotonic_ns():x}.{target_format}"
+        )
     
     async def batch_convert(
         self,
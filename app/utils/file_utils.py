@@ -2,9 +2,11 @@
 文件工具模块
 """
 import os
+import secrets
 import shutil
-import uuid
+import time
 import magic
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, List
 from datetime import datetime
@@ -13,6 +15,41 @@ from loguru import logger
 
 from app.config import TEMP_DIR, OUTPUT_DIR, MAX_FILE_SIZE, ALLOWED_EXTENSIONS
 
+# 导入时一次性展平扩展名表：校验热路径上只做哈希查找，
+# 不再每次调用都遍历 ALLOWED_EXTENSIONS 重建列表
+_EXT_SET = frozenset(
+    ext for ext_list in ALLOWED_EXTENSIONS.values() for ext in ext_list
+)
+_EXT_TO_TYPE = {
+    ext: file_type
+    for file_type, ext_list in ALLOWED_EXTENSIONS.items()
+    for ext in ext_list
+}
+
+@lru_cache(maxsize=4096)
+def _file_extension(filename: str) -> str:
+    """取小写扩展名
+
+    一次请求里 validate_file / get_file_info / MIME 校验会对同一文件名
+    反复取扩展名，模块级 lru_cache 让重复调用退化为字典探查
+    """
+    # 纯字符串取后缀，避免构造 PurePath；
+    # 与 Path.suffix 语义一致：无点、点在目录部分或隐藏文件返回空
+    slash = filename.rfind('/')
+    dot = filename.rfind('.')
+    if dot <= slash + 1:
+        return ''
+    return filename[dot + 1:].lower()
+
+
+# 进程级复用的 libmagic 句柄：magic.from_file 每次调用都要重建包装器
+# 并重新加载 magic 数据库，固定实例后探测只剩一次读取加分类
+try:
+    _MAGIC = magic.Magic(mime=True)
+except Exception as _magic_error:
+    logger.warning(f"初始化 libmagic 失败: {_magic_error}")
+    _MAGIC = None
+
 
 class FileUtils:
     """文件工具类"""
@@ -28,11 +65,13 @@ class FileUtils:
         Returns:
             唯一文件名
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        unique_id = str(uuid.uuid4())[:8]
-        extension = Path(original_name).suffix
-        original_name = original_name.replace(extension, '')
-        return f"{original_name}_{timestamp}_{unique_id}{extension}"
+        # splitext 一趟拆出主名和后缀（整串 replace 会误伤主名里含后缀
+        # 字面量的文件名）；token_hex 直接产出 8 位十六进制，
+        # 不必构造完整 UUID 再切片
+        stem, extension = os.path.splitext(original_name)
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        unique_id = secrets.token_hex(4)
+        return f"{stem}_{timestamp}_{unique_id}{extension}"
     
     @staticmethod
     def get_file_extension(filename: str) -> str:
@@ -45,7 +84,7 @@ class FileUtils:
         Returns:
             文件扩展名（小写）
         """
-        return Path(filename).suffix.lower().lstrip('.')
+        return _file_extension(filename)
     
     @staticmethod
     def is_allowed_extension(filename: str) -> bool:
@@ -58,11 +97,7 @@ class FileUtils:
         Returns:
             是否允许
         """
-        extension = FileUtils.get_file_extension(filename)
-        all_extensions = []
-        for ext_list in ALLOWED_EXTENSIONS.values():
-            all_extensions.extend(ext_list)
-        return extension in all_extensions
+        return FileUtils.get_file_extension(filename) in _EXT_SET
     
     @staticmethod
     def get_file_type(filename: str) -> Optional[str]:
@@ -75,12 +110,7 @@ class FileUtils:
         Returns:
             文件类型
         """
-        extension = FileUtils.get_file_extension(filename)
-        
-        for file_type, extensions in ALLOWED_EXTENSIONS.items():
-            if extension in extensions:
-                return file_type
-        return None
+        return _EXT_TO_TYPE.get(FileUtils.get_file_extension(filename))
     
     @staticmethod
     def detect_mime_type(file_path: str) -> str:
@@ -94,40 +124,66 @@ class FileUtils:
             MIME 类型
         """
         try:
-            mime = magic.from_file(file_path, mime=True)
-            return mime
+            if _MAGIC is not None:
+                return _MAGIC.from_file(file_path)
+            return magic.from_file(file_path, mime=True)
+        except Exception as e:
+            logger.warning(f"无法检测文件 MIME 类型: {e}")
+            return 'application/octet-stream'
+
+    @staticmethod
+    def detect_mime_type_from_buffer(buffer: bytes) -> str:
+        """
+        从内存字节检测 MIME 类型
+
+        已持有文件头部字节的调用方可以跳过一次打开和读取
+
+        Args:
+            buffer: 文件开头的字节
+
+        Returns:
+            MIME 类型
+        """
+        try:
+            if _MAGIC is not None:
+                return _MAGIC.from_buffer(buffer[:4096])
+            return magic.from_buffer(buffer[:4096], mime=True)
         except Exception as e:
             logger.warning(f"无法检测文件 MIME 类型: {e}")
             return 'application/octet-stream'
     
     @staticmethod
-    def get_file_size(file_path: str) -> int:
+    def get_file_size(file_path: str, stat_result: Optional[os.stat_result] = None) -> int:
         """
         获取文件大小
-        
+
         Args:
             file_path: 文件路径
-            
+            stat_result: 预先取得的 stat 结果（可选，避免重复系统调用）
+
         Returns:
             文件大小（字节）
         """
         try:
-            return os.path.getsize(file_path)
+            if stat_result is None:
+                stat_result = os.stat(file_path)
+            return stat_result.st_size
         except OSError:
             return 0
-    
+
     @staticmethod
-    def validate_file_size(file_path: str) -> bool:
+    def validate_file_size(file_path: str, stat_result: Optional[os.stat_result] = None) -> bool:
         """
         验证文件大小是否在允许范围内
-        
+
         Args:
             file_path: 文件路径
-            
+            stat_result: 预先取得的 stat 结果（可选，避免重复系统调用）
+
         Returns:
             是否有效
         """
-        file_size = FileUtils.get_file_size(file_path)
+        file_size = FileUtils.get_file_size(file_path, stat_result)
         return file_size <= MAX_FILE_SIZE
     
     @staticmethod
@@ -163,22 +219,52 @@ class FileUtils:
         output_path = OUTPUT_DIR / output_filename
         return str(output_path), output_filename
     
+    # 流式保存上传文件的块大小（1MB）
+    UPLOAD_CHUNK_SIZE = 1 << 20
+
     @staticmethod
     async def save_uploaded_file(uploaded_file, temp_path: str) -> bool:
         """
         保存上传的文件到临时目录
-        
+
+        按固定块流式写入，峰值内存与文件大小无关；
+        写入过程中超出 MAX_FILE_SIZE 立即中止并清理残留文件
+
         Args:
             uploaded_file: 上传的文件对象
             temp_path: 临时文件路径
-            
+
         Returns:
             是否保存成功
         """
         try:
-            async with aiofiles.open(temp_path, 'wb') as f:
-                content = await uploaded_file.read()
-                await f.write(content)
+            # 上传对象声明的大小已超限时直接拒绝，不写任何字节
+            declared_size = getattr(uploaded_file, 'size', None)
+            if declared_size and declared_size > MAX_FILE_SIZE:
+                logger.warning(f"上传文件声明大小超出限制，拒绝保存: {temp_path}")
+                return False
+
+            total_size = 0
+            oversized = False
+            # 1MB 写缓冲与读取块大小对齐，减少落盘 write 系统调用次数
+            async with aiofiles.open(
+                temp_path, 'wb', buffering=FileUtils.UPLOAD_CHUNK_SIZE
+            ) as f:
+                while True:
+                    chunk = await uploaded_file.read(FileUtils.UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    total_size += len(chunk)
+                    if total_size > MAX_FILE_SIZE:
+                        oversized = True
+                        break
+                    await f.write(chunk)
+
+            if oversized:
+                logger.warning(f"上传文件超出大小限制，已中止保存: {temp_path}")
+                FileUtils.cleanup_temp_file(temp_path)
+                return False
+
             return True
         except Exception as e:
             logger.error(f"保存上传文件失败: {e}")
@@ -195,14 +281,17 @@ class FileUtils:
         Returns:
             是否清理成功
         """
+        # EAFP：直接 unlink，省掉 exists 的一次 stat，
+        # 也消除了检查与删除之间的竞态窗口
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"临时文件已清理: {file_path}")
-                return True
-        except Exception as e:
+            os.unlink(file_path)
+            logger.info(f"临时文件已清理: {file_path}")
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
             logger.error(f"清理临时文件失败: {e}")
-        return False
+            return False
     
     @staticmethod
     def cleanup_old_files(directory: Path, max_age_hours: int) -> int:
@@ -218,21 +307,22 @@ class FileUtils:
         """
         if not directory.exists():
             return 0
-        
-        current_time = datetime.now()
+
+        # scandir 的 DirEntry 自带类型和 stat 缓存，每个条目少一次系统调用；
+        # 过期判断用一次算好的 Unix 时间戳，循环里不再构造 datetime
+        cutoff = time.time() - max_age_hours * 3600
         cleaned_count = 0
-        
+
         try:
-            for file_path in directory.iterdir():
-                if file_path.is_file():
-                    file_age = current_time - datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_age.total_seconds() > max_age_hours * 3600:
-                        file_path.unlink()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
                         cleaned_count += 1
-                        logger.info(f"清理旧文件: {file_path}")
+                        logger.info(f"清理旧文件: {entry.path}")
         except Exception as e:
             logger.error(f"清理旧文件时出错: {e}")
-        
+
         return cleaned_count
     
     @staticmethod
@@ -285,19 +375,26 @@ class FileUtils:
             return {}
     
     @staticmethod
-    def copy_file(src_path: str, dst_path: str) -> bool:
+    def copy_file(src_path: str, dst_path: str, preserve_metadata: bool = False) -> bool:
         """
         复制文件
-        
+
+        默认只复制内容：copyfile 在 Linux 上走内核的零拷贝快路径，
+        也省去 copy2 附带的 chmod/utimes 元数据调用
+
         Args:
             src_path: 源文件路径
             dst_path: 目标文件路径
-            
+            preserve_metadata: 是否保留权限和时间戳等元数据
+
         Returns:
             是否复制成功
         """
         try:
-            shutil.copy2(src_path, dst_path)
+            if preserve_metadata:
+                shutil.copy2(src_path, dst_path)
+            else:
+                shutil.copyfile(src_path, dst_path)
             return True
         except Exception as e:
             logger.error(f"复制文件失败: {e}")